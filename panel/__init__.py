@@ -12,7 +12,7 @@ from . import widgets # noqa
 from .config import config, panel_extension as extension # noqa
 from .interact import interact # noqa
 from .io import state # noqa
-from .layout import Row, Column, WidgetBox, Tabs, Spacer, GridSpec # noqa
+from .layout import Row, Column, WidgetBox, Tabs, Spacer, GridSpec, VirtualColumn # noqa
 from .pane import panel, Pane # noqa
 from .param import Param # noqa
 from .template import Template # noqa
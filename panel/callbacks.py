@@ -6,10 +6,15 @@ from __future__ import absolute_import, division, unicode_literals
 
 
 import time
+
+from functools import partial
+
 import param
 
 from bokeh.io import curdoc as _curdoc
 
+from .io.state import state
+
 
 class PeriodicCallback(param.Parameterized):
     """
@@ -22,7 +27,8 @@ class PeriodicCallback(param.Parameterized):
     """
 
     callback = param.Callable(doc="""
-       The callback to execute periodically.""")
+       The callback to execute periodically. Coroutine functions are
+       scheduled on the running IOLoop.""")
 
     count = param.Integer(default=None, doc="""
         Number of times the callback will be executed, by default
@@ -56,7 +62,10 @@ class PeriodicCallback(param.Parameterized):
             self._cb.start()
 
     def _periodic_callback(self):
-        self.callback()
+        if self._doc and state._thread_pool is not None:
+            state._submit(self._doc, partial(state.execute, self.callback))
+        else:
+            state.execute(self.callback)
         self._counter += 1
         if self._timeout is not None:
             dt = (time.time() - self._start_time)
@@ -51,6 +51,11 @@ class _config(param.Parameterized):
     raw_css = param.List(default=[], doc="""
         List of raw CSS strings to add to the template.""")
 
+    prototypes = param.Boolean(default=False, doc="""
+        Whether to render Viewables served to multiple sessions once
+        and clone the rendered models for each new session, instead
+        of rendering them from scratch for every session.""")
+
     _embed = param.Boolean(default=False, allow_None=True, doc="""
         Whether plot data will be embedded.""")
 
@@ -70,6 +75,33 @@ class _config(param.Parameterized):
         Whether to inline JS and CSS resources.
         If disabled, resources are loaded from CDN if one is available.""")
 
+    _nthreads = param.Integer(default=None, allow_None=True, bounds=(0, None), doc="""
+        The number of threads in the pool used to process events and
+        periodic callbacks on a server. Events are processed on the
+        IOLoop if no threads are configured. Slow images, e.g.
+        Matplotlib plots, are rendered on this pool, on a small
+        dedicated pool if no threads are configured or on the IOLoop
+        if the number of threads is zero.""")
+
+    _render_cache_size = param.Integer(default=16*1024*1024, bounds=(0, None), doc="""
+        The maximum size in bytes of the process-wide cache of text
+        rendered by the Markdown, HTML and LaTeX panes. Setting the
+        size to zero disables the cache.""")
+
+    _content_store_size = param.Integer(default=64*1024*1024, bounds=(0, None), doc="""
+        The maximum size in bytes of the content, e.g. image data,
+        served to clients over HTTP by a Panel server.""")
+
+    _fetch_cache_size = param.Integer(default=256*1024*1024, bounds=(0, None), doc="""
+        The maximum size in bytes of the on-disk cache of remote
+        content, e.g. images referenced by URL. Setting the size to
+        zero disables the cache.""")
+
+    _fetch_timeout = param.Number(default=10, bounds=(0, None), doc="""
+        The number of seconds to wait for a response when fetching
+        remote content, e.g. images referenced by URL. Setting the
+        timeout to zero waits indefinitely.""")
+
     _truthy = ['True', 'true', '1', True, 1]
 
     def __init__(self, **params):
@@ -146,6 +178,66 @@ class _config(param.Parameterized):
     def embed_load_path(self, value):
         self._embed_load_path_ = value
 
+    @property
+    def nthreads(self):
+        if self._nthreads_ is not None:
+            return self._nthreads_
+        else:
+            nthreads = os.environ.get('PANEL_NTHREADS', _config._nthreads)
+            return None if nthreads is None else int(nthreads)
+
+    @nthreads.setter
+    def nthreads(self, value):
+        self._nthreads_ = value
+
+    @property
+    def render_cache_size(self):
+        if self._render_cache_size_ is not None:
+            return self._render_cache_size_
+        else:
+            size = os.environ.get('PANEL_RENDER_CACHE_SIZE', _config._render_cache_size)
+            return int(size)
+
+    @render_cache_size.setter
+    def render_cache_size(self, value):
+        self._render_cache_size_ = value
+
+    @property
+    def content_store_size(self):
+        if self._content_store_size_ is not None:
+            return self._content_store_size_
+        else:
+            size = os.environ.get('PANEL_CONTENT_STORE_SIZE', _config._content_store_size)
+            return int(size)
+
+    @content_store_size.setter
+    def content_store_size(self, value):
+        self._content_store_size_ = value
+
+    @property
+    def fetch_cache_size(self):
+        if self._fetch_cache_size_ is not None:
+            return self._fetch_cache_size_
+        else:
+            size = os.environ.get('PANEL_FETCH_CACHE_SIZE', _config._fetch_cache_size)
+            return int(size)
+
+    @fetch_cache_size.setter
+    def fetch_cache_size(self, value):
+        self._fetch_cache_size_ = value
+
+    @property
+    def fetch_timeout(self):
+        if self._fetch_timeout_ is not None:
+            return self._fetch_timeout_
+        else:
+            timeout = os.environ.get('PANEL_FETCH_TIMEOUT', _config._fetch_timeout)
+            return float(timeout)
+
+    @fetch_timeout.setter
+    def fetch_timeout(self, value):
+        self._fetch_timeout_ = value
+
     @property
     def inline(self):
         if self._inline_ is not None:
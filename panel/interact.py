@@ -123,6 +123,8 @@ class interactive(PaneBase):
 
     manual_name = param.String(default='Run Interact')
 
+    _applies_by_type = True
+
     def __init__(self, object, params={}, **kwargs):
         if signature is None:
             raise ImportError('interact requires either recent Python version '
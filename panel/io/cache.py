@@ -0,0 +1,188 @@
+"""
+Implements process-wide caches shared by all sessions, e.g. the HTML
+generated from Markdown source and the image data served to clients.
+"""
+from __future__ import absolute_import, division, unicode_literals
+
+import hashlib
+import sys
+import threading
+
+from collections import OrderedDict
+
+
+class RenderCache(object):
+    """
+    A least-recently-used cache of rendered text keyed by a hash of
+    the source text and the options it was rendered with. The total
+    size of the cached output is bounded by the supplied maximum
+    number of bytes or, if no maximum is supplied, by the
+    render_cache_size config option.
+    """
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @classmethod
+    def key(cls, source, *options):
+        """
+        Returns the cache key for the supplied source text and
+        rendering options.
+        """
+        if not isinstance(source, bytes):
+            source = source.encode('utf-8')
+        return (hashlib.sha1(source).hexdigest(),)+options
+
+    def _max_bytes(self):
+        if self.max_bytes is not None:
+            return self.max_bytes
+        from ..config import config
+        return config.render_cache_size
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return default
+            self._entries[key] = entry
+            return entry[0]
+
+    def _sizeof(self, value):
+        return sys.getsizeof(value)
+
+    def put(self, key, value):
+        max_bytes = self._max_bytes()
+        nbytes = self._sizeof(value)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.nbytes -= entry[1]
+            if nbytes > max_bytes:
+                return
+            self._entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+            self._evict(max_bytes)
+
+    def _evict(self, max_bytes):
+        while self.nbytes > max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def render(self, render, source, *options):
+        """
+        Returns the output of render(source), rendering it only if
+        the source text has not already been rendered with the same
+        options.
+
+        Arguments
+        ---------
+        render: callable
+          Function which renders the source text.
+        source: str
+          The source text to render.
+        options: hashable
+          Options the output depends on besides the source text.
+
+        Returns
+        -------
+        The rendered output.
+        """
+        if not self._max_bytes():
+            return render(source)
+        key = self.key(source, *options)
+        output = self.get(key)
+        if output is None:
+            output = render(source)
+            self.put(key, output)
+        return output
+
+
+class ContentStore(RenderCache):
+    """
+    A least-recently-used store of binary content, e.g. image data,
+    keyed by the SHA1 hash of the content, which allows the content
+    to be served to clients over HTTP instead of being inlined in
+    the models. The total size of the stored content is bounded by
+    the supplied maximum number of bytes or, if no maximum is
+    supplied, by the content_store_size config option. Content which
+    is pinned, because it is referenced by live models, is never
+    evicted.
+    """
+
+    def __init__(self, max_bytes=None):
+        super(ContentStore, self).__init__(max_bytes)
+        self._pins = {}
+
+    def _max_bytes(self):
+        if self.max_bytes is not None:
+            return self.max_bytes
+        from ..config import config
+        return config.content_store_size
+
+    def _sizeof(self, value):
+        return len(value[0])
+
+    def _evict(self, max_bytes):
+        for key in list(self._entries):
+            if self.nbytes <= max_bytes:
+                break
+            elif key in self._pins:
+                continue
+            _, evicted = self._entries.pop(key)
+            self.nbytes -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._pins.clear()
+        super(ContentStore, self).clear()
+
+    def pin(self, key):
+        """
+        Pins the content so it is not evicted until it is unpinned,
+        returning False if the content is no longer stored.
+        """
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._pins[key] = self._pins.get(key, 0) + 1
+            return True
+
+    def unpin(self, key):
+        """
+        Releases a pin on the content, evicting content which no
+        longer fits in the store once it is no longer pinned.
+        """
+        with self._lock:
+            count = self._pins.pop(key, 0) - 1
+            if count > 0:
+                self._pins[key] = count
+            self._evict(self._max_bytes())
+
+    def add(self, data, mimetype):
+        """
+        Adds the supplied data to the store, returning the key it is
+        served under or None if it exceeds the size of the store.
+        """
+        key = hashlib.sha1(data).hexdigest()
+        if self.get(key) is None:
+            self.put(key, (data, mimetype))
+        return key if key in self else None
+
+
+render_cache = RenderCache()
+
+content_store = ContentStore()
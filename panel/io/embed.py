@@ -106,7 +106,7 @@ def embed_state(panel, model, doc, max_states=1000, max_opts=3,
     _, _, _, comm = state._views[target]
 
     model.tags.append('embedded')
-    widgets = [w for w in panel.select(Widget) if w._supports_embed
+    widgets = [w for w in panel._cached_select(Widget) if w._supports_embed
                and w not in Link.registry]
     state_model = State()
 
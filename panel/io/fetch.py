@@ -0,0 +1,244 @@
+"""
+Implements a shared fetcher for remote content, e.g. the images
+referenced by URL in the image panes, which reuses connections,
+revalidates content with conditional requests and caches it on disk.
+"""
+from __future__ import absolute_import, division, unicode_literals
+
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import threading
+
+# os.replace is not available on Python 2, where os.rename atomically
+# replaces the destination on POSIX systems
+_replace = getattr(os, 'replace', os.rename)
+
+
+def _default_cache_dir():
+    """
+    Returns the per-user directory remote content is cached in.
+    """
+    cache_home = (os.environ.get('XDG_CACHE_HOME') or
+                  os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(cache_home, 'panel', 'fetch')
+
+
+class Fetcher(object):
+    """
+    Fetches remote content over HTTP(S) using a pooled requests
+    Session. Fetched content is cached on disk alongside its ETag and
+    Last-Modified headers, which are used to make conditional requests
+    when the content is fetched again. The total size of the cached
+    content is bounded by the supplied maximum number of bytes or, if
+    no maximum is supplied, by the fetch_cache_size config option,
+    evicting the least recently used content first. Requests time out
+    after the supplied number of seconds or, if no timeout is
+    supplied, after the fetch_timeout config option.
+
+    The cache directory defaults to a per-user directory, which is
+    created accessible only to the user. Content is never cached in
+    a directory owned by another user or writable by other users.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=None, max_workers=4,
+                 timeout=None):
+        if cache_dir is None:
+            cache_dir = _default_cache_dir()
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._session = None
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        """
+        The requests Session used to pool connections.
+        """
+        if self._session is None:
+            import requests
+            with self._lock:
+                if self._session is None:
+                    self._session = requests.Session()
+        return self._session
+
+    @property
+    def executor(self):
+        """
+        The thread pool fetching content asynchronously.
+        """
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _max_bytes(self):
+        if self.max_bytes is not None:
+            return self.max_bytes
+        from ..config import config
+        return config.fetch_cache_size
+
+    def _timeout(self):
+        if self.timeout is not None:
+            return self.timeout
+        from ..config import config
+        return config.fetch_timeout
+
+    def _path(self, url):
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key+'.bin')
+
+    def _secure_dir(self):
+        """
+        Creates the cache directory if it does not exist and returns
+        whether it is safe to use, i.e. it is owned by the user and
+        not writable by other users.
+        """
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.makedirs(self.cache_dir, 0o700)
+            st = os.stat(self.cache_dir)
+        except OSError:
+            return False
+        if hasattr(os, 'getuid') and st.st_uid != os.getuid():
+            return False
+        return not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+    def cached(self, url):
+        """
+        Returns a tuple of the cached content of the URL and its
+        validating headers or (None, {}) if the URL is not cached.
+        """
+        path = self._path(url)
+        try:
+            with open(path, 'rb') as f:
+                meta = json.loads(f.readline().decode('utf-8'))
+                data = f.read()
+        except (IOError, OSError, ValueError):
+            return None, {}
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return data, meta
+
+    def _store(self, url, data, meta):
+        """
+        Stores the content and its validating headers in a single
+        file, which is written to a temporary file and then moved into
+        place so concurrent readers, including other processes, never
+        observe partially written content.
+        """
+        max_bytes = self._max_bytes()
+        if len(data) > max_bytes or not self._secure_dir():
+            return
+        header = json.dumps(meta).encode('utf-8')+b'\n'
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header)
+                f.write(data)
+            _replace(tmp_path, self._path(url))
+        except (IOError, OSError):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._evict(max_bytes)
+
+    def _evict(self, max_bytes):
+        if not os.path.isdir(self.cache_dir):
+            return
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.bin'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        nbytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if nbytes <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            nbytes -= size
+
+    def clear(self):
+        """
+        Removes all cached content.
+        """
+        with self._lock:
+            self._evict(-1)
+
+    def fetch(self, url):
+        """
+        Fetches the content of the URL, making a conditional request
+        if the content is cached. If the request fails the cached
+        content is returned if available.
+
+        Arguments
+        ---------
+        url: str
+          The URL to fetch.
+
+        Returns
+        -------
+        The content as bytes.
+        """
+        import requests
+        data, meta = self.cached(url)
+        headers = {}
+        if data is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        try:
+            r = self.session.get(url, headers=headers, timeout=self._timeout() or None)
+        except requests.RequestException:
+            if data is None:
+                raise
+            return data
+        if r.status_code == 304 and data is not None:
+            return data
+        elif not r.ok and data is not None:
+            return data
+        meta = {'etag': r.headers.get('ETag'),
+                'last_modified': r.headers.get('Last-Modified')}
+        if r.ok and self._max_bytes():
+            self._store(url, r.content, meta)
+        return r.content
+
+    def fetch_async(self, url):
+        """
+        Fetches the content of the URL on a thread pool without
+        blocking the caller.
+
+        Arguments
+        ---------
+        url: str
+          The URL to fetch.
+
+        Returns
+        -------
+        A concurrent.futures.Future resolving to the content as bytes.
+        """
+        return self.executor.submit(self.fetch, url)
+
+
+fetcher = Fetcher()
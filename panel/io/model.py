@@ -5,6 +5,8 @@ from __future__ import absolute_import, division, unicode_literals
 
 import textwrap
 
+from contextlib import contextmanager
+
 from bokeh.document import Document
 from bokeh.models import Model, Box
 from bokeh.protocol import Protocol
@@ -53,6 +55,23 @@ def add_to_doc(obj, doc, hold=False):
         doc.hold()
 
 
+@contextmanager
+def hold(doc, policy='combine'):
+    """
+    Context manager that holds events on the supplied Document,
+    dispatching any events collected in the meantime as a single
+    batch on exit. Has no effect if the Document is already held.
+    """
+    held = doc._hold
+    if not held:
+        doc.hold(policy)
+    try:
+        yield
+    finally:
+        if not held:
+            doc.unhold()
+
+
 def bokeh_repr(obj, depth=0, ignored=['children', 'text', 'name', 'toolbar', 'renderers', 'below', 'center', 'left', 'right']):
     """
     Returns a string repr for a bokeh model, useful for recreating
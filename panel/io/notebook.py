@@ -33,6 +33,7 @@ from .embed import embed_state
 from .model import add_to_doc, diff
 from .server import _server_url, _origin_url, get_server
 from .state import state
+from .stats import timed
 
 
 #---------------------------------------------------------------------
@@ -66,10 +67,39 @@ for (var event of events) {{
 }}
 """
 
-def get_comm_customjs(change, client_comm, plot_id, timeout=5000, debounce=50):
+THROTTLE_JS = """
+if (window.PyViz.throttle === undefined) {{
+  window.PyViz.throttle = {{}};
+}}
+var key = '{plot_id}_' + cb_obj.id + '_{change}';
+var throttle = window.PyViz.throttle[key];
+if (throttle === undefined) {{
+  throttle = window.PyViz.throttle[key] = {{last: 0, timeout: null}};
+}}
+function send() {{
+  throttle.last = Date.now();
+  {callback}
+}}
+var wait = {throttle} - (Date.now() - throttle.last);
+if (wait <= 0) {{
+  send();
+}} else if (throttle.timeout === null) {{
+  throttle.timeout = setTimeout(function() {{
+    throttle.timeout = null;
+    send();
+  }}, wait);
+}}
+"""
+
+
+def get_comm_customjs(change, client_comm, plot_id, timeout=5000,
+                      debounce=50, throttle=None):
     """
     Returns a CustomJS callback that can be attached to send the
-    model state across the notebook comms.
+    model state across the notebook comms. If a throttle interval
+    (in milliseconds) is supplied events are sent immediately but at
+    most once per interval, with the latest value always being sent
+    once the interval has elapsed, otherwise they are debounced.
     """
     # Abort callback if value matches last received event
     abort = ABORT_JS.format(plot_id=plot_id, change=change)
@@ -79,12 +109,17 @@ cb_obj.event_name = '{change}';"""
 
     fetch_data = data_template.format(change=change)
     self_callback = JS_CALLBACK.format(
-        comm_id=client_comm.id, timeout=timeout, debounce=debounce,
+        comm_id=client_comm.id, timeout=timeout,
+        debounce=0 if throttle is not None else debounce,
         plot_id=plot_id)
-    return CustomJS(code='\n'.join([abort, fetch_data, self_callback]))
-
+    callback = '\n'.join([fetch_data, self_callback])
+    if throttle is not None:
+        callback = THROTTLE_JS.format(plot_id=plot_id, change=change,
+                                      callback=callback, throttle=throttle)
+    return CustomJS(code='\n'.join([abort, callback]))
 
 
+@timed
 def push(doc, comm, binary=True):
     """
     Pushes events stored on the document across the provided comm.
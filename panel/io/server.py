@@ -6,10 +6,14 @@ from __future__ import absolute_import, division, unicode_literals
 import signal
 import threading
 
+from collections import deque
 from functools import partial
 
+from bokeh.document import Document
 from bokeh.server.server import Server
+from tornado.web import HTTPError, RequestHandler
 
+from .cache import content_store
 from .state import state
 
 
@@ -17,6 +21,21 @@ from .state import state
 # Private API
 #---------------------------------------------------------------------
 
+# The route the ContentHandler is registered on
+CONTENT_ROUTE = '/panel/content/'
+
+
+def _modify_doc(panel, server_id, pool, content_url, doc):
+    """
+    Registers the root-relative URL the content store is served on
+    for the Document of a new session before rendering the panel.
+    """
+    state._content_urls[doc] = content_url
+    if pool is None:
+        return panel._modify_doc(server_id, doc)
+    return panel._modify_doc(server_id, doc, pool=pool)
+
+
 def _origin_url(url):
     if url.startswith("http"):
         url = url.split("//")[1]
@@ -29,12 +48,77 @@ def _server_url(url, port):
     else:
         return 'http://%s:%d%s' % (url.split(':')[0], port, "/")
 
+
+class _SessionPool(object):
+    """
+    Pool of views of a Viewable rendered ahead of time on detached
+    Documents, which are handed to new sessions as they connect. The
+    pool is refilled on the IOLoop, rendering one view per iteration
+    so that incoming requests are not held up.
+    """
+
+    def __init__(self, viewable, size, loop):
+        self.viewable = viewable
+        self.size = size
+        self.loop = loop
+        self._views = deque()
+        self._filling = False
+
+    def __len__(self):
+        return len(self._views)
+
+    def _fill(self):
+        self._filling = False
+        if len(self._views) >= self.size:
+            return
+        doc = Document()
+        root = self.viewable._render_server_view(doc)
+        self._views.append((root, doc))
+        self.schedule()
+
+    def schedule(self):
+        """
+        Schedules rendering the next view if the pool is not full.
+        """
+        if not self._filling and len(self._views) < self.size:
+            self._filling = True
+            self.loop.add_callback(self._fill)
+
+    def pop(self):
+        """
+        Returns a (root, doc) tuple of a view rendered ahead of time
+        (or None if the pool is empty) and schedules a refill.
+        """
+        view = self._views.popleft() if self._views else None
+        self.schedule()
+        return view
+
+
+class ContentHandler(RequestHandler):
+    """
+    Serves the content registered in the content store, e.g. image
+    data rendered by the image panes. Since content is keyed by its
+    hash it never changes and clients may cache it indefinitely.
+    """
+
+    def compute_etag(self):
+        return '"%s"' % self.path_args[0]
+
+    def get(self, key):
+        content = content_store.get(key)
+        if content is None:
+            raise HTTPError(404)
+        data, mimetype = content
+        self.set_header('Content-Type', mimetype)
+        self.set_header('Cache-Control', 'public, max-age=31536000, immutable')
+        self.write(data)
+
 #---------------------------------------------------------------------
 # Public API
 #---------------------------------------------------------------------
 
 def get_server(panel, port=0, websocket_origin=None, loop=None,
-               show=False, start=False, **kwargs):
+               show=False, start=False, warm_sessions=0, **kwargs):
     """
     Returns a Server instance with this panel attached as the root
     app.
@@ -56,6 +140,9 @@ def get_server(panel, port=0, websocket_origin=None, loop=None,
       Whether to open the server in a new browser tab on start
     start : boolean(optional, default=False)
       Whether to start the Server
+    warm_sessions : int (optional, default=0)
+      The number of sessions to render ahead of time in the background,
+      which are handed to clients as they connect.
     kwargs: dict
       Additional keyword arguments to pass to Server instance
 
@@ -77,8 +164,21 @@ def get_server(panel, port=0, websocket_origin=None, loop=None,
             websocket_origin = [websocket_origin]
         opts['allow_websocket_origin'] = websocket_origin
 
+    prefix = opts.get('prefix') or ''
+    prefix = '/' + prefix.strip('/') if prefix.strip('/') else ''
+    patterns = list(opts.get('extra_patterns', []))
+    patterns.append((CONTENT_ROUTE+'([0-9a-f]+)', ContentHandler))
+    opts['extra_patterns'] = patterns
+    content_url = prefix + CONTENT_ROUTE
+
     server_id = kwargs.pop('server_id', None)
-    server = Server({'/': partial(panel._modify_doc, server_id)}, port=port, **opts)
+    if warm_sessions:
+        pool = _SessionPool(panel, warm_sessions, opts['io_loop'])
+        pool.schedule()
+    else:
+        pool = None
+    modify_doc = partial(_modify_doc, panel, server_id, pool, content_url)
+    server = Server({'/': modify_doc}, port=port, **opts)
     if server_id:
         state._servers[server_id] = (server, panel, [])
 
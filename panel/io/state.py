@@ -3,7 +3,13 @@ Various utilities for recording and embedding state in a rendered app.
 """
 from __future__ import absolute_import, division, unicode_literals
 
+import inspect
 import threading
+import weakref
+
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from functools import partial
 
 import param
 
@@ -11,6 +17,82 @@ from bokeh.document import Document
 from bokeh.io import curdoc as _curdoc
 from pyviz_comms import CommManager as _CommManager
 
+from ..util import MutableMapping
+from .stats import stats as _stats
+
+
+class _ViewRegistry(MutableMapping):
+    """
+    Index of all currently active views mapping from the id of each
+    root model to a tuple of the (viewable, root, doc, comm). Views
+    are grouped by Document and held until they are explicitly
+    evicted, i.e. once the session of a server Document is destroyed
+    or the output of a notebook cell is deleted.
+    """
+
+    def __init__(self):
+        self._refs = {}
+        self._docs = {}
+
+    def __getitem__(self, ref):
+        doc = self._refs[ref]
+        viewable, root, comm = self._docs[doc][ref]
+        return (viewable, root, doc, comm)
+
+    def __setitem__(self, ref, view):
+        if ref in self._refs:
+            del self[ref]
+        viewable, root, doc, comm = view
+        if doc not in self._docs:
+            self._docs[doc] = OrderedDict()
+        self._docs[doc][ref] = (viewable, root, comm)
+        self._refs[ref] = doc
+
+    def __delitem__(self, ref):
+        doc = self._refs.pop(ref)
+        views = self._docs.get(doc, {})
+        views.pop(ref, None)
+        if not views:
+            self._docs.pop(doc, None)
+
+    def __iter__(self):
+        return iter(list(self._refs))
+
+    def __len__(self):
+        return len(self._refs)
+
+    def documents(self):
+        """
+        Returns all Documents with active views.
+        """
+        return list(self._docs)
+
+    def views(self, doc):
+        """
+        Returns the (viewable, root, doc, comm) tuples of all active
+        views in the supplied Document.
+        """
+        return [(viewable, root, doc, comm) for viewable, root, comm
+                in list(self._docs.get(doc, {}).values())]
+
+    def models(self, viewable, doc):
+        """
+        Returns the (model, parent) tuples of all models of the
+        supplied Reactive rendered in the supplied Document.
+        """
+        return [viewable._models[ref] for ref in list(self._docs.get(doc, []))
+                if ref in viewable._models]
+
+    def evict(self, doc):
+        """
+        Evicts all views of the supplied Document, returning the
+        evicted (viewable, root, doc, comm) tuples.
+        """
+        views = self.views(doc)
+        for ref in list(self._docs.pop(doc, [])):
+            self._refs.pop(ref, None)
+        return views
+
 
 class _state(param.Parameterized):
     """
@@ -25,6 +107,10 @@ class _state(param.Parameterized):
     webdriver = param.Parameter(default=None, doc="""
         Selenium webdriver used to export bokeh models to pngs.""")
 
+    # Records timings of the methods which sync Panel objects with
+    # their bokeh models
+    stats = _stats
+
     # Whether to hold comm events
     _hold = False
 
@@ -34,30 +120,336 @@ class _state(param.Parameterized):
     _comm_manager = _CommManager
 
     # An index of all currently active views
-    _views = {}
+    _views = _ViewRegistry()
 
     # An index of all curently active servers
     _servers = {}
 
+    # The URLs the content store is served on, indexed by the
+    # Documents of the server sessions serving it
+    _content_urls = weakref.WeakKeyDictionary()
+
+    # Model updates waiting for the next tick, indexed by Document.
+    # The pending state is indexed weakly and discarded once the
+    # session of a Document is destroyed, so Documents are released
+    # even if their scheduled flush never runs.
+    _pending_updates = weakref.WeakKeyDictionary()
+
+    # Comms waiting to push held events, indexed by Document
+    _pending_pushes = weakref.WeakKeyDictionary()
+
+    # Documents held by the hold context manager and their hold count
+    _held_docs = weakref.WeakKeyDictionary()
+
+    # Guards the pending updates which may be scheduled from threads
+    _lock = threading.RLock()
+
+    # Thread pool used to process events and the callbacks queued on
+    # it for each Document, ensuring they are processed in order
+    _executor = None
+    _thread_queues = weakref.WeakKeyDictionary()
+
+    # Holds the Document processed on the current thread
+    _local = threading.local()
+
     def _unblocked(self, doc):
         thread = threading.current_thread()
         thread_id = thread.ident if thread else None
         return (doc is self.curdoc and self._thread_id == thread_id)
 
+    def _schedule_update(self, doc, callback, comm=None):
+        """
+        Queues a model update to be applied on the next tick of the
+        supplied Document. All updates queued on a Document within one
+        tick are applied in a single callback while the Document is
+        held, ensuring they are dispatched as one batch of events.
+        """
+        with self._lock:
+            pending = self._pending_updates.get(doc)
+            if pending is None:
+                pending = self._pending_updates[doc] = []
+                if doc.session_context and hasattr(doc, 'on_session_destroyed'):
+                    doc.on_session_destroyed(self._destroy_session)
+                if doc not in self._held_docs:
+                    doc.add_next_tick_callback(partial(self._flush_updates, doc))
+            pending.append((callback, comm))
+
+    def _flush_updates(self, doc):
+        """
+        Applies all model updates queued on the supplied Document.
+        """
+        from .model import hold
+        if doc in self._held_docs:
+            return
+        with self._lock:
+            pending = self._pending_updates.pop(doc, [])
+        # Defer pushes until all updates have been applied
+        self._held_docs[doc] = 1
+        try:
+            if any(comm is not None for _, comm in pending):
+                self._apply_pending(pending)
+            else:
+                with hold(doc):
+                    self._apply_pending(pending)
+        finally:
+            del self._held_docs[doc]
+        if doc in self._pending_updates:
+            self._release(doc)
+        self._flush_pushes(doc)
+
+    def _apply_pending(self, pending):
+        """
+        Applies the queued model updates, ensuring that an update which
+        fails does not prevent the remaining updates from being applied.
+        """
+        for callback, _ in pending:
+            try:
+                callback()
+            except Exception as e:
+                self.param.warning('Applying update %s failed: %s: %s'
+                                   % (callback, type(e).__name__, e),
+                                   exc_info=True)
+
+    def _release(self, doc):
+        """
+        Applies updates collected on a Document which is no longer
+        held, deferring them to the next tick unless it is safe to
+        modify the Document from the current context.
+        """
+        pending = self._pending_updates.get(doc, [])
+        server = all(comm is None for _, comm in pending)
+        if pending and server and not self._unblocked(doc):
+            doc.add_next_tick_callback(partial(self._flush_updates, doc))
+        else:
+            self._flush_updates(doc)
+
+    def _schedule_push(self, doc, comm):
+        """
+        Pushes the events held on a Document across the supplied comm.
+        If the Document is held or the IOLoop is running, e.g. inside
+        a Jupyter kernel, pushes are combined into a single message.
+        """
+        loop = _running_loop()
+        if loop is None and doc not in self._held_docs:
+            from .notebook import push
+            push(doc, comm)
+            return
+        pushes = self._pending_pushes.get(doc)
+        if pushes is None:
+            pushes = self._pending_pushes[doc] = OrderedDict()
+            if loop is not None:
+                loop.add_callback(partial(self._flush_pushes, doc))
+        pushes[id(comm)] = comm
+
+    def _flush_pushes(self, doc):
+        """
+        Pushes the events held on a Document across all pending comms.
+        """
+        from .notebook import push
+        if doc in self._held_docs:
+            return
+        for comm in self._pending_pushes.pop(doc, {}).values():
+            push(doc, comm)
+
+    @property
+    def _thread_pool(self):
+        """
+        The thread pool used to process events on a server, which is
+        (re)created whenever the configured number of threads changes.
+        """
+        from ..config import config
+        nthreads = config.nthreads
+        executor = self._executor
+        if executor is not None and executor._max_workers != nthreads:
+            executor.shutdown(wait=False)
+            executor = type(self)._executor = None
+        if executor is None and nthreads:
+            from concurrent.futures import ThreadPoolExecutor
+            executor = type(self)._executor = ThreadPoolExecutor(max_workers=nthreads)
+        return executor
+
+    def _submit(self, doc, callback):
+        """
+        Submits a callback to the thread pool. Callbacks submitted for
+        the same Document are executed one at a time in the order they
+        were submitted. Any model updates they make are applied on the
+        next tick of the Document.
+        """
+        with self._lock:
+            queue = self._thread_queues.get(doc)
+            if queue is not None:
+                queue.append(callback)
+                return
+            self._thread_queues[doc] = deque([callback])
+        self._thread_pool.submit(self._run_queue, doc)
+
+    def _run_queue(self, doc):
+        """
+        Executes the callbacks queued for a Document on the current
+        thread until the queue is exhausted.
+        """
+        while True:
+            with self._lock:
+                queue = self._thread_queues.get(doc)
+                if not queue:
+                    self._thread_queues.pop(doc, None)
+                    return
+                callback = queue.popleft()
+            self._local.curdoc = doc
+            try:
+                callback()
+            except Exception as e:
+                self.param.warning('Processing %s on a thread failed: %s: %s'
+                                   % (callback, type(e).__name__, e),
+                                   exc_info=True)
+            finally:
+                del self._local.curdoc
+
+    def _register_view(self, viewable, root, doc, comm=None):
+        """
+        Registers a view on the supplied Document, evicting all views
+        of the Document once its session is destroyed.
+        """
+        if doc not in self._views._docs and comm is None:
+            if hasattr(doc, 'on_session_destroyed'):
+                doc.on_session_destroyed(self._destroy_session)
+        self._views[root.ref['id']] = (viewable, root, doc, comm)
+
+    def _destroy_session(self, session_context):
+        """
+        Server lifecycle hook which cleans up all views and pending
+        events of a Document once its session is destroyed.
+        """
+        doc = session_context._document
+        for viewable, root, _, _ in self._views.evict(doc):
+            if root.ref['id'] in getattr(viewable, '_models', {}):
+                viewable._cleanup(root)
+        for pending in (self._pending_updates, self._pending_pushes,
+                        self._held_docs, self._thread_queues,
+                        self._content_urls):
+            pending.pop(doc, None)
+
+    def _get_documents(self, viewables):
+        """
+        Returns the Documents the supplied Viewables are rendered in.
+        """
+        if viewables:
+            refs = [ref for v in viewables for ref in v._models]
+        elif self.curdoc:
+            return [self.curdoc]
+        else:
+            return self._views.documents()
+        docs = []
+        for ref in refs:
+            if ref not in self._views:
+                continue
+            doc = self._views[ref][2]
+            if not any(doc is d for d in docs):
+                docs.append(doc)
+        return docs
+
     @property
     def curdoc(self):
-        if self._curdoc:
+        if hasattr(self._local, 'curdoc'):
+            return self._local.curdoc
+        elif self._curdoc:
             return self._curdoc
         elif _curdoc().session_context:
             return _curdoc()
 
     @curdoc.setter
     def curdoc(self, doc):
-        self._curdoc = doc
+        if hasattr(self._local, 'curdoc'):
+            self._local.curdoc = doc
+        else:
+            self._curdoc = doc
 
     @property
     def session_args(self):
         return self.curdoc.session_context.request.arguments if self.curdoc else {}
 
+    def execute(self, callback, *args, **kwargs):
+        """
+        Executes the callback with the supplied arguments. Coroutine
+        functions are scheduled on the running IOLoop so they do not
+        block it, e.g. while awaiting a slow query. Any model updates
+        a coroutine makes on a server are applied on the next tick of
+        the Document while the Document is locked. If no IOLoop is
+        running coroutines are run to completion.
+
+        Arguments
+        ---------
+        callback: callable
+          The (coroutine) function to execute
+        *args, **kwargs:
+          The arguments to call the callback with
+        """
+        if not _is_coroutine_function(callback):
+            return callback(*args, **kwargs)
+        loop = _running_loop()
+        if loop is None:
+            from tornado.ioloop import IOLoop
+            return IOLoop.current().run_sync(partial(callback, *args, **kwargs))
+        loop.add_callback(callback, *args, **kwargs)
+
+    @contextmanager
+    def hold(self, *viewables):
+        """
+        Context manager which holds all Documents the supplied
+        Viewables are rendered in. Changes made inside the block are
+        collected and released as a single batch of events on exit,
+        both on a server and in the notebook. If no Viewables are
+        supplied the current server Document, or otherwise all active
+        Documents, are held.
+
+        Arguments
+        ---------
+        viewables: panel.viewable.Viewable
+          The components whose Documents should be held
+        """
+        docs = self._get_documents(viewables)
+        for doc in docs:
+            self._held_docs[doc] = self._held_docs.get(doc, 0) + 1
+        try:
+            yield
+        finally:
+            for doc in docs:
+                count = self._held_docs.pop(doc) - 1
+                if count:
+                    self._held_docs[doc] = count
+                else:
+                    self._release(doc)
+
+
+def _is_coroutine_function(callback):
+    """
+    Whether the callback is a native or tornado coroutine function.
+    """
+    from tornado import gen
+    func = callback.func if isinstance(callback, partial) else callback
+    iscoroutinefunction = getattr(inspect, 'iscoroutinefunction', None)
+    if iscoroutinefunction is not None and iscoroutinefunction(func):
+        return True
+    return getattr(gen, 'is_coroutine_function', lambda f: False)(func)
+
+
+def _running_loop():
+    """
+    Returns the IOLoop of the current thread if it is running.
+    """
+    try:
+        import asyncio
+        if not asyncio.get_event_loop().is_running():
+            return None
+    except Exception:
+        return None
+    from tornado.ioloop import IOLoop
+    return IOLoop.current()
+
 
 state = _state()
+
+# Allows param versions which support coroutine watchers to schedule
+# them on the running IOLoop
+if hasattr(param.parameterized, 'async_executor'):
+    param.parameterized.async_executor = state.execute
@@ -0,0 +1,192 @@
+"""
+Utilities for recording timings and call counts of the internal
+methods which synchronize Panel objects with their bokeh models.
+"""
+from __future__ import absolute_import, division, unicode_literals
+
+import json
+import threading
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+from timeit import default_timer
+
+import param
+
+from bokeh.document import Document
+
+
+class Stats(param.Parameterized):
+    """
+    Records the number of calls and the time spent in the instrumented
+    methods of the Reactive sync pipeline, aggregated by method,
+    component class and session. Recording is disabled by default and
+    may be enabled by setting the enabled parameter or temporarily
+    using the record context manager. Timings are inclusive, i.e. the
+    time spent in a method includes the time spent in all the calls
+    it makes to other instrumented methods.
+    """
+
+    enabled = param.Boolean(default=False, doc="""
+        Whether timings are currently being recorded.""")
+
+    def __init__(self, **params):
+        super(Stats, self).__init__(**params)
+        self._records = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _add(self, method, cls, session, duration):
+        key = (method, cls, session)
+        with self._lock:
+            record = self._records.get(key)
+            if record is None:
+                record = self._records[key] = [0, 0., 0.]
+            record[0] += 1
+            record[1] += duration
+            record[2] = max(record[2], duration)
+
+    @contextmanager
+    def record(self):
+        """
+        Context manager which records timings while the context is
+        active.
+        """
+        enabled = self.enabled
+        self.enabled = True
+        try:
+            yield self
+        finally:
+            self.enabled = enabled
+
+    def reset(self):
+        """
+        Discards all recorded timings.
+        """
+        with self._lock:
+            self._records.clear()
+
+    def summary(self, by='class'):
+        """
+        Returns the recorded timings aggregated by method and the
+        supplied grouping.
+
+        Arguments
+        ---------
+        by: str or None
+          Whether to group by 'class', 'session' or neither (None).
+
+        Returns
+        -------
+        A dictionary mapping from method name to a dictionary of
+        the call count, total time and maximum time (in seconds) of
+        the method or to a dictionary of such dictionaries indexed
+        by the grouping.
+        """
+        if by not in ('class', 'session', None):
+            raise ValueError("Stats may only be grouped by 'class', "
+                             "'session' or None, not %r." % by)
+        with self._lock:
+            records = sorted(self._records.items(), key=lambda r: str(r[0]))
+        summary = OrderedDict()
+        for (method, cls, session), (count, total, maximum) in records:
+            group = summary.setdefault(method, OrderedDict())
+            if by is not None:
+                key = cls if by == 'class' else session
+                group = group.setdefault(key, OrderedDict())
+            group['count'] = group.get('count', 0) + count
+            group['total'] = group.get('total', 0.) + total
+            group['max'] = max(group.get('max', 0.), maximum)
+        return summary
+
+    def to_json(self, filename=None, by='class', indent=2):
+        """
+        Dumps the recorded timings to JSON.
+
+        Arguments
+        ---------
+        filename: str or None
+          Optional filename to write the JSON to.
+        by: str or None
+          Whether to group by 'class', 'session' or neither (None).
+        indent: int
+          The JSON indentation level.
+
+        Returns
+        -------
+        The JSON string.
+        """
+        dumped = json.dumps(self.summary(by), indent=indent)
+        if filename is not None:
+            with open(filename, 'w') as f:
+                f.write(dumped)
+        return dumped
+
+
+stats = Stats(name='stats')
+
+
+def _session_id(args):
+    """
+    Returns the id of the session an instrumented call belongs to,
+    given the arguments it was called with.
+    """
+    from .state import state
+    doc = None
+    for arg in args:
+        if isinstance(arg, Document):
+            doc = arg
+            break
+    else:
+        doc = state.curdoc
+    context = doc.session_context if doc is not None else None
+    return context.id if context is not None else None
+
+
+def _record(name, obj, args, method, kwargs):
+    if not stats.enabled:
+        return method(*args, **kwargs)
+    local = stats._local
+    active = getattr(local, 'active', None)
+    if active is None:
+        active = local.active = set()
+    key = (id(obj), name)
+    if key in active:
+        return method(*args, **kwargs)
+    cls = None if obj is None else type(obj).__name__
+    active.add(key)
+    start = default_timer()
+    try:
+        return method(*args, **kwargs)
+    finally:
+        active.discard(key)
+        stats._add(name, cls, _session_id(args), default_timer()-start)
+
+
+def timed(method):
+    """
+    Decorator which records the timings of calls to the decorated
+    function or method on the global stats object. Nested calls to
+    the same method on the same object, e.g. through super, are only
+    recorded once. Methods which subclasses override should instead
+    be instrumented where they are called using timed_call.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapped(*args, **kwargs):
+        obj = args[0] if args and not isinstance(args[0], Document) else None
+        return _record(name, obj, args, method, kwargs)
+    return wrapped
+
+
+def timed_call(method, *args, **kwargs):
+    """
+    Calls the supplied bound method with the supplied arguments,
+    recording the timing of the call on the global stats object under
+    the name of the method and the class of the object it is bound
+    to. Instruments the call including any subclass overrides.
+    """
+    obj = getattr(method, '__self__', None)
+    return _record(method.__name__, obj, args, method, kwargs)
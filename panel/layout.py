@@ -4,7 +4,10 @@ in flexible ways to build complex dashboards.
 """
 from __future__ import absolute_import, division, unicode_literals
 
-from collections import OrderedDict
+import math
+
+from collections import Counter, OrderedDict
+from functools import partial
 
 import param
 import numpy as np
@@ -14,7 +17,12 @@ from bokeh.models import (Column as BkColumn, Row as BkRow,
                           Box as BkBox, Markup as BkMarkup)
 from bokeh.models.widgets import Tabs as BkTabs, Panel as BkPanel
 
+from .config import config
+from .io.model import hold
+from .io.state import state
+from .io.stats import timed_call
 from .util import param_name, param_reprs
+from .models.layout import VirtualColumn as BkVirtualColumn
 from .viewable import Reactive
 
 
@@ -34,6 +42,10 @@ class Panel(Reactive):
 
     _linked_props = []
 
+    def __init__(self, **params):
+        super(Panel, self).__init__(**params)
+        self.param.watch(self._invalidate_selections, 'objects')
+
     def __repr__(self, depth=0, max_depth=10):
         if depth > max_depth:
             return '...'
@@ -58,22 +70,27 @@ class Panel(Reactive):
     #----------------------------------------------------------------
 
     def _update_model(self, events, msg, root, model, doc, comm=None):
+        if 'objects' in events:
+            # Models may be updated before other watchers are called
+            self._invalidate_selections()
+        changed = []
         if self._rename['objects'] in msg:
             old = events['objects'].old
-            msg[self._rename['objects']] = self._get_objects(model, old, doc, root, comm)
+            msg[self._rename['objects']] = timed_call(self._get_objects, model, old, doc, root, comm)
+            changed = [self]
+
+        if comm is None:
+            with hold(doc):
+                self._apply_update(msg, root, model, changed)
+        else:
+            self._apply_update(msg, root, model, changed)
 
-        held = doc._hold
-        if comm is None and not held:
-            doc.hold()
+    def _apply_update(self, msg, root, model, changed=None):
         model.update(**msg)
 
-        from .io import state
         ref = root.ref['id']
         if ref in state._views:
-            state._views[ref][0]._preprocess(root)
-
-        if comm is None and not held:
-            doc.unhold()
+            state._views[ref][0]._preprocess(root, changed)
 
     #----------------------------------------------------------------
     # Model API
@@ -88,21 +105,31 @@ class Panel(Reactive):
     def _get_objects(self, model, old_objects, doc, root, comm=None):
         """
         Returns new child models for the layout while reusing unchanged
-        models and cleaning up any dropped objects.
+        models and cleaning up any dropped objects. Only the Python-side
+        model creation is incremental, the returned list replaces the
+        children of the model and is sent to the frontend in full since
+        Bokeh has no partial update event for list properties (the
+        mutation methods of ListPanel splice recorded deltas instead,
+        see ListPanel._apply_delta).
         """
         from .pane import panel
         new_models = []
-        for i, pane in enumerate(self.objects):
-            pane = panel(pane)
-            self.objects[i] = pane
-
+        for i, obj in enumerate(self.objects):
+            pane = panel(obj)
+            if pane is not obj:
+                self.objects[i] = pane
+
+        # Diff the objects by identity to avoid quadratic list scans
+        new_ids = {id(obj) for obj in self.objects}
+        old_ids = {id(obj) for obj in old_objects}
         for obj in old_objects:
-            if obj not in self.objects:
+            if id(obj) not in new_ids:
                 obj._cleanup(root)
 
-        for i, pane in enumerate(self.objects):
-            if pane in old_objects:
-                child, _ = pane._models[root.ref['id']]
+        ref = root.ref['id']
+        for pane in self.objects:
+            if id(pane) in old_ids and ref in pane._models:
+                child, _ = pane._models[ref]
             else:
                 child = pane._get_model(doc, root, model, comm)
             new_models.append(child)
@@ -112,7 +139,7 @@ class Panel(Reactive):
         model = self._bokeh_model()
         if root is None:
             root = model
-        objects = self._get_objects(model, [], doc, root, comm)
+        objects = timed_call(self._get_objects, model, [], doc, root, comm)
         props = dict(self._init_properties(), objects=objects)
         model.update(**self._process_param_change(props))
         self._models[root.ref['id']] = (model, parent)
@@ -128,25 +155,14 @@ class Panel(Reactive):
     # Public API
     #----------------------------------------------------------------
 
-    def select(self, selector=None):
-        """
-        Iterates over the Viewable and any potential children in the
-        applying the Selector.
+    def _selection_version(self):
+        return self._children_version
 
-        Arguments
-        ---------
-        selector: type or callable or None
-          The selector allows selecting a subset of Viewables by
-          declaring a type or callable function to filter by.
-
-        Returns
-        -------
-        viewables: list(Viewable)
-        """
-        objects = super(Panel, self).select(selector)
+    def _traverse(self):
+        yield self
         for obj in self:
-            objects += obj.select(selector)
-        return objects
+            for child in obj._traverse():
+                yield child
 
 
 
@@ -173,7 +189,101 @@ class ListPanel(Panel):
                                  "as positional arguments or as a keyword, "
                                  "not both." % type(self).__name__)
             params['objects'] = [panel(pane) for pane in objects]
-        super(Panel, self).__init__(**params)
+        super(ListPanel, self).__init__(**params)
+        self._delta = None
+        self._object_ids = Counter(id(obj) for obj in self.objects)
+        self.param.watch(self._sync_object_ids, 'objects')
+
+    #----------------------------------------------------------------
+    # Callback API
+    #----------------------------------------------------------------
+
+    def _set_objects(self, objects, op, index, new=[]):
+        """
+        Sets the objects recording the delta to the previous objects,
+        which is either an 'insert' of the new objects, a 'remove' or
+        a 'replace' of the object at the supplied index. The
+        identities of the objects are tracked incrementally so the
+        delta can be applied without scanning the objects.
+        """
+        ids = self._object_ids
+        reused = {id(obj) for obj in new if ids[id(obj)]}
+        removed = None
+        if op in ('remove', 'replace'):
+            removed = self.objects[index]
+            orphaned = ids[id(removed)] == 1 and id(removed) not in {id(obj) for obj in new}
+        else:
+            orphaned = False
+        self._delta = (self.objects, objects, op, index, reused, orphaned, new)
+        self.objects = objects
+        if removed is not None:
+            ids[id(removed)] -= 1
+            if not ids[id(removed)]:
+                del ids[id(removed)]
+        ids.update(id(obj) for obj in new)
+
+    def _sync_object_ids(self, event):
+        if self._delta is not None and event.new is self._delta[1]:
+            return
+        self._object_ids = Counter(id(obj) for obj in event.new)
+
+    def _update_model(self, events, msg, root, model, doc, comm=None):
+        if 'objects' in events:
+            self._invalidate_selections()
+        delta = self._get_delta(events, model)
+        if delta is None:
+            super(ListPanel, self)._update_model(events, msg, root, model, doc, comm)
+            return
+        msg = {k: v for k, v in msg.items() if k != self._rename['objects']}
+        # Only the newly added objects have to be preprocessed
+        changed = list(delta[-1])
+        if comm is None:
+            with hold(doc):
+                self._apply_delta(delta, root, model, doc, comm)
+                self._apply_update(msg, root, model, changed)
+        else:
+            self._apply_delta(delta, root, model, doc, comm)
+            self._apply_update(msg, root, model, changed)
+
+    def _get_delta(self, events, model):
+        """
+        Returns the recorded delta if it describes the objects event
+        and the model is in sync with the previous objects.
+        """
+        if self._delta is None or 'objects' not in events:
+            return None
+        event = events['objects']
+        old, new = self._delta[:2]
+        if event.old is not old or event.new is not new:
+            return None
+        children = getattr(model, self._rename['objects'])
+        if len(children) != len(old):
+            return None
+        return self._delta
+
+    def _apply_delta(self, delta, root, model, doc, comm=None):
+        """
+        Applies a delta recorded by one of the mutation methods to the
+        children of the model in place, rendering only new objects.
+        """
+        old, new, op, index, reused, orphaned, objects = delta
+        ref = root.ref['id']
+        children = getattr(model, self._rename['objects'])
+        if orphaned:
+            old[index]._cleanup(root)
+        models = []
+        for obj in objects:
+            if ref in obj._models and id(obj) in reused:
+                child, _ = obj._models[ref]
+            else:
+                child = obj._get_model(doc, root, model, comm)
+            models.append(child)
+        if op == 'insert':
+            children[index:index] = models
+        elif op == 'remove':
+            del children[index]
+        else:
+            children[index] = models[0]
 
     #----------------------------------------------------------------
     # Public API
@@ -227,7 +337,11 @@ class ListPanel(Panel):
         for i, pane in zip(range(start, end), panes):
             new_objects[i] = panel(pane)
 
-        self.objects = new_objects
+        if isinstance(index, slice):
+            self.objects = new_objects
+        else:
+            index = index if index >= 0 else len(new_objects)+index
+            self._set_objects(new_objects, 'replace', index, new_objects[index:index+1])
 
     def clone(self, *objects, **params):
         """
@@ -266,7 +380,7 @@ class ListPanel(Panel):
         from .pane import panel
         new_objects = list(self)
         new_objects.append(panel(obj))
-        self.objects = new_objects
+        self._set_objects(new_objects, 'insert', len(self), new_objects[-1:])
 
     def clear(self):
         """
@@ -285,7 +399,7 @@ class ListPanel(Panel):
         from .pane import panel
         new_objects = list(self)
         new_objects.extend(list(map(panel, objects)))
-        self.objects = new_objects
+        self._set_objects(new_objects, 'insert', len(self), new_objects[len(self):])
 
     def insert(self, index, obj):
         """
@@ -299,7 +413,8 @@ class ListPanel(Panel):
         from .pane import panel
         new_objects = list(self)
         new_objects.insert(index, panel(obj))
-        self.objects = new_objects
+        index = min(max(index if index >= 0 else len(self)+index, 0), len(self))
+        self._set_objects(new_objects, 'insert', index, new_objects[index:index+1])
 
     def pop(self, index):
         """
@@ -313,7 +428,8 @@ class ListPanel(Panel):
         if index in new_objects:
             index = new_objects.index(index)
         obj = new_objects.pop(index)
-        self.objects = new_objects
+        index = index if index >= 0 else len(self)+index
+        self._set_objects(new_objects, 'remove', index)
         return obj
 
     def remove(self, obj):
@@ -325,8 +441,9 @@ class ListPanel(Panel):
         obj (object): The object to remove from the layout.
         """
         new_objects = list(self)
-        new_objects.remove(obj)
-        self.objects = new_objects
+        index = new_objects.index(obj)
+        new_objects.pop(index)
+        self._set_objects(new_objects, 'remove', index)
 
     def reverse(self):
         """
@@ -353,6 +470,155 @@ class Column(ListPanel):
     _bokeh_model = BkColumn
 
 
+class VirtualColumn(ListPanel):
+    """
+    Vertical layout of Viewables which scrolls its contents and only
+    renders the children in the visible window, plus a number of
+    overscan children on either side. The children outside the window
+    are replaced by spacers sized using the estimated item_height and
+    rendered as the window is scrolled.
+    """
+
+    height = param.Integer(default=400, bounds=(0, None), doc="""
+        The height of the scrollable window.""")
+
+    item_height = param.Integer(default=50, bounds=(1, None), doc="""
+        The estimated height of each child in pixels, used to determine
+        the visible children and to size the spacers for the children
+        outside the window.""")
+
+    overscan = param.Integer(default=5, bounds=(0, None), doc="""
+        The number of children rendered beyond either edge of the
+        visible window.""")
+
+    _bokeh_model = BkVirtualColumn
+
+    # The rendered window is tracked for each view
+    _prototype_safe = False
+
+    _rename = {'objects': 'children', 'overscan': None}
+
+    def __init__(self, *objects, **params):
+        super(VirtualColumn, self).__init__(*objects, **params)
+        self._windows = {}
+        self._rendered = {}
+
+    #----------------------------------------------------------------
+    # Callback API
+    #----------------------------------------------------------------
+
+    def _link_props(self, model, properties, doc, root, comm=None):
+        super(VirtualColumn, self)._link_props(model, properties, doc, root, comm)
+        if comm is None:
+            cb = partial(self._scroll_change, root, model, doc, None)
+            model.on_change('scroll_index', cb)
+        elif not config.embed:
+            cb = partial(self._comm_scroll, root, model, doc, comm)
+            client_comm = state._comm_manager.get_client_comm(on_msg=cb)
+            customjs = self._get_customjs('scroll_index', client_comm, root.ref['id'])
+            model.js_on_change('scroll_index', customjs)
+
+    def _scroll_change(self, root, model, doc, comm, attr, old, new):
+        if self._in_window(root, model):
+            return
+        children = timed_call(self._get_objects, model, [], doc, root, comm)
+        if comm is None:
+            with hold(doc):
+                self._apply_update({'children': children}, root, model, [self])
+        else:
+            self._apply_update({'children': children}, root, model, [self])
+            state._schedule_push(doc, comm)
+
+    def _comm_scroll(self, root, model, doc, comm, msg):
+        if 'scroll_index' not in msg:
+            return
+        model.scroll_index = msg['scroll_index']
+        self._scroll_change(root, model, doc, comm, 'scroll_index', None,
+                            msg['scroll_index'])
+
+    def _get_delta(self, events, model):
+        # Children are windowed so deltas cannot be applied directly
+        return None
+
+    def _get_window(self, model):
+        """
+        Returns the start and end index of the children to render
+        given the scroll position of the model.
+        """
+        first = min(model.scroll_index, max(len(self)-1, 0))
+        visible = int(math.ceil(self.height/float(self.item_height)))
+        start = max(first-self.overscan, 0)
+        end = min(first+visible+self.overscan, len(self))
+        return start, end
+
+    def _in_window(self, root, model):
+        """
+        Whether all visible children are already rendered.
+        """
+        ref = root.ref['id']
+        if ref not in self._windows:
+            return False
+        start, end = self._windows[ref]
+        first = model.scroll_index
+        visible = int(math.ceil(self.height/float(self.item_height)))
+        return start <= first and (first+visible <= end or end == len(self))
+
+    #----------------------------------------------------------------
+    # Model API
+    #----------------------------------------------------------------
+
+    def _get_objects(self, model, old_objects, doc, root, comm=None):
+        """
+        Returns the spacers and the child models in the current window
+        while reusing already rendered models and cleaning up the
+        models of children which are no longer in the window.
+        """
+        from .pane import panel
+        for i, obj in enumerate(self.objects):
+            pane = panel(obj)
+            if pane is not obj:
+                self.objects[i] = pane
+
+        ref = root.ref['id']
+        start, end = self._get_window(model)
+        window = self.objects[start:end]
+        window_ids = {id(obj) for obj in window}
+        rendered = self._rendered.get(ref, [])
+        rendered_ids = {id(obj) for obj in rendered}
+        for obj in rendered:
+            if id(obj) not in window_ids:
+                obj._cleanup(root)
+
+        children = []
+        for pane in window:
+            if id(pane) in rendered_ids and ref in pane._models:
+                child, _ = pane._models[ref]
+            else:
+                child = pane._get_model(doc, root, model, comm)
+            children.append(child)
+        self._windows[ref] = (start, end)
+        self._rendered[ref] = window
+
+        # Reuse the spacers standing in for children outside the window
+        spacers = [c for c in model.children if isinstance(c, BkSpacer)
+                   and 'virtual-spacer' in c.tags]
+        heights = (start*self.item_height, (len(self)-end)*self.item_height)
+        for i, height in enumerate(heights):
+            if len(spacers) > i:
+                spacers[i].height = height
+            else:
+                spacers.append(BkSpacer(height=height, width=0, tags=['virtual-spacer']))
+        return [spacers[0]] + children + [spacers[1]]
+
+    def _cleanup(self, root):
+        # Only rendered children have to be cleaned up
+        super(Panel, self)._cleanup(root)
+        ref = root.ref['id']
+        self._windows.pop(ref, None)
+        for p in self._rendered.pop(ref, []):
+            p._cleanup(root)
+
+
 class WidgetBox(ListPanel):
     """
     Vertical layout of widgets.
@@ -387,6 +653,10 @@ class Tabs(ListPanel):
     closable = param.Boolean(default=False, doc="""
         Whether it should be possible to close tabs.""")
 
+    dynamic = param.Boolean(default=False, doc="""
+        Whether to defer rendering the inactive tabs until they are
+        first selected, displaying a placeholder until then.""")
+
     objects = param.List(default=[], doc="""
         The list of child objects that make up the tabs.""")
 
@@ -400,7 +670,7 @@ class Tabs(ListPanel):
 
     _bokeh_model = BkTabs
 
-    _rename = {'objects': 'tabs'}
+    _rename = {'objects': 'tabs', 'dynamic': None}
 
     _linked_props = ['active']
 
@@ -413,10 +683,7 @@ class Tabs(ListPanel):
             items = params['objects']
         objects, self._names = self._to_objects_and_names(items)
         super(Tabs, self).__init__(*objects, **params)
-        self.param.watch(self._update_names, 'objects')
-        # ALERT: Ensure that name update happens first, should be
-        #        replaced by watch precedence support in param
-        self._param_watchers['objects']['value'].reverse()
+        self._names_watcher = self.param.watch(self._update_names, 'objects')
 
     def _to_object_and_name(self, item):
         from .pane import panel
@@ -438,7 +705,7 @@ class Tabs(ListPanel):
 
     def _init_properties(self):
         return {k: v for k, v in self.param.get_param_values()
-                if v is not None and k != 'closable'}
+                if v is not None and k not in ('closable', 'dynamic')}
 
     #----------------------------------------------------------------
     # Callback API
@@ -457,6 +724,12 @@ class Tabs(ListPanel):
             names.append(name)
         self._names = names
 
+    def _link_params(self):
+        super(Tabs, self)._link_params()
+        # Ensure names are updated before the models are
+        watchers = self._param_watchers['objects']['value']
+        watchers.insert(0, watchers.pop(watchers.index(self._names_watcher)))
+
     #----------------------------------------------------------------
     # Model API
     #----------------------------------------------------------------
@@ -466,8 +739,30 @@ class Tabs(ListPanel):
             closable = msg.pop('closable')
             for child in model.tabs:
                 child.closable = closable
+        if self.dynamic and 'active' in events and 'tabs' not in msg:
+            if comm is None:
+                with hold(doc):
+                    self._render_active(root, model, doc, comm)
+            else:
+                self._render_active(root, model, doc, comm)
         super(Tabs, self)._update_model(events, msg, root, model, doc, comm)
 
+    def _render_active(self, root, model, doc, comm=None):
+        """
+        Replaces the placeholder of the active tab with the model of
+        the tab contents when the tabs are rendered dynamically.
+        """
+        if not (0 <= self.active < len(model.tabs)):
+            return
+        tab = model.tabs[self.active]
+        if 'dynamic-placeholder' not in tab.child.tags:
+            return
+        pane = self.objects[self.active]
+        tab.child = pane._get_model(doc, root, model, comm)
+        ref = root.ref['id']
+        if ref in state._views:
+            state._views[ref][0]._preprocess(root, [pane])
+
     def _get_objects(self, model, old_objects, doc, root, comm=None):
         """
         Returns new child models for the layout while reusing unchanged
@@ -480,22 +775,34 @@ class Tabs(ListPanel):
                              'that the Tabs.objects are not modified '
                              'directly. Found %d names, expected %d.' %
                              (len(self._names), len(self)))
-        for i, (name, pane) in enumerate(zip(self._names, self)):
-            pane = panel(pane, name=name)
-            self.objects[i] = pane
+        for i, (name, obj) in enumerate(zip(self._names, self)):
+            pane = panel(obj, name=name)
+            if pane is not obj:
+                self.objects[i] = pane
 
+        new_ids = {id(obj) for obj in self.objects}
+        old_ids = {id(obj) for obj in old_objects}
         for obj in old_objects:
-            if obj not in self.objects:
+            if id(obj) not in new_ids:
                 obj._cleanup(root)
 
+        # Reuse the tab panels wrapping unchanged child models
+        panels = {id(panel.child): panel for panel in model.tabs}
+        ref = root.ref['id']
         for i, (name, pane) in enumerate(zip(self._names, self)):
-            if pane in old_objects:
-                child, _ = pane._models[root.ref['id']]
+            if id(pane) in old_ids and ref in pane._models:
+                child, _ = pane._models[ref]
+            elif self.dynamic and i != self.active:
+                child = BkSpacer(tags=['dynamic-placeholder'])
             else:
                 child = pane._get_model(doc, root, model, comm)
-            child = BkPanel(title=name, name=pane.name, child=child,
-                            closable=self.closable)
-            new_models.append(child)
+            tab = panels.pop(id(child), None)
+            if tab is None:
+                tab = BkPanel(title=name, name=pane.name, child=child,
+                              closable=self.closable)
+            else:
+                tab.update(title=name, name=pane.name, closable=self.closable)
+            new_models.append(tab)
         return new_models
 
     #----------------------------------------------------------------
@@ -670,12 +977,19 @@ class GridSpec(Panel):
 
     _bokeh_model = BkGridBox
 
+    # The rendered objects are tracked for each view
+    _prototype_safe = False
+
     _rename = {'objects': 'children', 'mode': None}
 
     def __init__(self, **params):
         if 'objects' not in params:
             params['objects'] = OrderedDict()
         super(GridSpec, self).__init__(**params)
+        self._index = None
+        self._indexed = False
+        self._rendered = {}
+        self.param.watch(self._invalidate_index, 'objects')
 
     def _init_properties(self):
         properties = super(GridSpec, self)._init_properties()
@@ -687,6 +1001,11 @@ class GridSpec(Panel):
         return properties
 
     def _get_objects(self, model, old_objects, doc, root, comm=None):
+        """
+        Returns the child models and their positions on the grid while
+        reusing the models of objects whose size has not changed since
+        they were last rendered and cleaning up any dropped objects.
+        """
         if self.ncols:
             width = int(float(self.width)/self.ncols)
         else:
@@ -697,6 +1016,11 @@ class GridSpec(Panel):
         else:
             height = 0
 
+        # The objects are modified in place so changes are determined
+        # from the objects and sizes rendered previously on this root
+        ref = root.ref['id']
+        rendered = self._rendered.get(ref, {})
+        current = {}
         children = []
         for (y0, x0, y1, x1), obj in self.objects.items():
             x0 = 0 if x0 is None else x0
@@ -709,32 +1033,43 @@ class GridSpec(Panel):
                 properties = {'width': w*width, 'height': h*height}
             else:
                 properties = {'sizing_mode': self.sizing_mode}
-            obj.set_param(**properties)
-            model = obj._get_model(doc, root, model, comm)
+            current[id(obj)] = (obj, properties)
+
+            previous = rendered.get(id(obj))
+            if previous is not None and ref in obj._models:
+                child, _ = obj._models[ref]
+                if previous[1] == properties:
+                    children.append((child, r, c, h, w))
+                    continue
+                obj.set_param(**properties)
+            else:
+                obj.set_param(**properties)
+                child = obj._get_model(doc, root, model, comm)
 
-            if isinstance(model, BkMarkup) and self.sizing_mode not in ['fixed', None]:
-                if model.style is None:
-                    model.style = {}
+            if isinstance(child, BkMarkup) and self.sizing_mode not in ['fixed', None]:
+                if child.style is None:
+                    child.style = {}
                 style = {}
-                if 'width' not in model.style:
+                if 'width' not in child.style:
                     style['width'] = '100%'
-                if 'height' not in model.style:
+                if 'height' not in child.style:
                     style['height'] = '100%'
                 if style:
-                    model.style.update(style)
+                    child.style.update(style)
 
-            if isinstance(model, BkBox) and len(model.children) == 1:
-                model.children[0].update(**properties)
+            if isinstance(child, BkBox) and len(child.children) == 1:
+                child.children[0].update(**properties)
             else:
-                model.update(**properties)
-            children.append((model, r, c, h, w))
+                child.update(**properties)
+            children.append((child, r, c, h, w))
 
-        new_objects = list(self.objects.values())
         if isinstance(old_objects, dict):
             old_objects = list(old_objects.values())
-        for old in old_objects:
-            if old not in new_objects:
+        dropped = [obj for obj, _ in rendered.values()] + list(old_objects)
+        for old in dropped:
+            if id(old) not in current and ref in old._models:
                 old._cleanup(root)
+        self._rendered[ref] = current
         return children
 
     @property
@@ -747,18 +1082,47 @@ class GridSpec(Panel):
         min_yidx = [y0 for (y0, x0, _, _) in self.objects if y0 is not None]
         return min(min_yidx) if min_yidx and len(min_yidx) == len(self.objects) else 0
 
-    @property
-    def _object_grid(self):
-        grid = np.full((self.nrows, self.ncols), None)
-        for i, ((y0, x0, y1, x1), obj) in enumerate(self.objects.items()):
-            l = 0 if x0 is None else x0
-            r = self.ncols if x1 is None else x1
-            t = 0 if y0 is None else y0
-            b = self.nrows if y1 is None else y1
-            for y in range(t, b):
-                for x in range(l, r):
-                    grid[y, x] = {((y0, x0, y1, x1), obj)}
-        return grid
+    def _get_index(self):
+        """
+        Returns the spatial index of the objects, which is rebuilt
+        lazily after the objects are changed or if the objects were
+        added or removed in place.
+        """
+        if self._index is None or len(self._index) != len(self.objects):
+            self._index = _GridIndex(self.objects)
+        return self._index
+
+    def _invalidate_index(self, event):
+        if not self._indexed:
+            self._index = None
+
+    def _trigger_objects(self):
+        """
+        Triggers the objects after the index was updated in place.
+        """
+        self._indexed = True
+        try:
+            self.param.trigger('objects')
+        finally:
+            self._indexed = False
+
+    def _cleanup(self, root):
+        super(Panel, self)._cleanup(root)
+        self._rendered.pop(root.ref['id'], None)
+        for p in self:
+            p._cleanup(root)
+
+    def _remove(self, keys):
+        """
+        Removes the objects with the supplied keys, updating the index
+        in place where possible.
+        """
+        index = self._index
+        for key in keys:
+            del self.objects[key]
+            if index is not None and not index.remove(key):
+                index = None
+        self._index = index
 
     #----------------------------------------------------------------
     # Public API
@@ -766,24 +1130,15 @@ class GridSpec(Panel):
 
     @property
     def nrows(self):
-        max_yidx = [y1 for (_, _, y1, _) in self.objects if y1 is not None]
-        return max(max_yidx) if max_yidx else 0
+        return self._get_index().nrows
 
     @property
     def ncols(self):
-        max_xidx = [x1 for (_, _, _, x1) in self.objects if x1 is not None]
-        return max(max_xidx) if max_xidx else 0
+        return self._get_index().ncols
 
     @property
     def grid(self):
-        grid = np.zeros((self.nrows, self.ncols), dtype='uint8')
-        for (y0, x0, y1, x1) in self.objects:
-            x0 = 0 if x0 is None else x0
-            x1 = self.ncols if x1 is None else x1
-            y0 = 0 if y0 is None else y0
-            y1 = self.nrows if y1 is None else y1
-            grid[y0:y1, x0:x1] += 1
-        return grid
+        return self._get_index().occupancy.copy()
 
     def clone(self, **params):
         """
@@ -810,16 +1165,11 @@ class GridSpec(Panel):
         else:
             yidx, xidx = index, slice(None)
 
-        subgrid = self._object_grid[yidx, xidx]
-        if isinstance(subgrid, np.ndarray):
-            deleted = OrderedDict([list(o)[0] for o in subgrid.flatten()])
-        else:
-            deleted = [list(subgrid)[0][0]]
+        deleted, _ = self._get_index().lookup(yidx, xidx)
         if deleted:
-            for key in deleted:
-                del self.objects[key]
+            self._remove(deleted)
             if trigger:
-                self.param.trigger('objects')
+                self._trigger_objects()
 
     def __getitem__(self, index):
         if isinstance(index, tuple):
@@ -827,10 +1177,10 @@ class GridSpec(Panel):
         else:
             yidx, xidx = index, slice(None)
 
-        subgrid = self._object_grid[yidx, xidx]
-        if isinstance(subgrid, np.ndarray):
+        keys, scalar = self._get_index().lookup(yidx, xidx)
+        if not scalar:
             params = dict(self.get_param_values())
-            params['objects'] = OrderedDict([list(o)[0] for o in subgrid.flatten()])
+            params['objects'] = OrderedDict([(key, self.objects[key]) for key in keys])
             gspec = GridSpec(**params)
             xoff, yoff = gspec._xoffset, gspec._yoffset
             adjusted = []
@@ -853,8 +1203,11 @@ class GridSpec(Panel):
             if gspec.max_height:
                 gspec.max_height = int(gspec.max_height * height_scale)
             return gspec
+        elif keys:
+            return self.objects[keys[0]]
         else:
-            return list(subgrid)[0][1]
+            raise IndexError('No object found at index (%s, %s) of %s.'
+                             % (yidx, xidx, type(self).__name__))
 
     def __setitem__(self, index, obj):
         from .pane.base import Pane
@@ -872,27 +1225,22 @@ class GridSpec(Panel):
         else:
             y0, y1 = (yidx, yidx+1)
 
-        l = 0 if x0 is None else x0
-        r = self.nrows if x1 is None else x1
-        t = 0 if y0 is None else y0
-        b = self.ncols if y1 is None else y1
-
         key = (y0, x0, y1, x1)
-        overlap = key in self.objects
-        clone = self.clone(mode='override')
-        if not overlap:
-            clone.objects[key] = Pane(obj)
-            grid = clone.grid
-        else:
-            grid = clone.grid
+        grid_index = self._get_index()
+        if not grid_index.fits(key):
+            # Index the objects on the grid extended to fit the key
+            shape = (max(grid_index.nrows, y1 or 0), max(grid_index.ncols, x1 or 0))
+            grid_index = _GridIndex(grid_index.keys, shape)
+        t, l, b, r = grid_index.bounds(key)
+        overlap = key in self.objects or grid_index.occupancy[t:b, l:r].any()
+
+        if overlap:
+            grid = grid_index.occupancy.copy()
             grid[t:b, l:r] += 1
-
-        overlap_grid = grid>1
-        if (overlap_grid).any():
             overlapping = ''
             objects = []
-            for (yidx, xidx) in zip(*np.where(overlap_grid)):
-                old_obj = self[yidx, xidx]
+            for (yidx, xidx) in zip(*np.where(grid>1)):
+                old_obj = self.objects[grid_index.key_at(yidx, xidx)]
                 if old_obj not in objects:
                     objects.append(old_obj)
                     overlapping += '    (%d, %d): %s\n\n' % (yidx, xidx, old_obj)
@@ -905,9 +1253,127 @@ class GridSpec(Panel):
                 raise IndexError(overlap_text)
             elif self.mode == 'warn':
                 self.param.warning(overlap_text)
-            self.__delitem__(index, False)
+            deleted, _ = grid_index.lookup(slice(t, b), slice(l, r))
+            self._remove(deleted)
+        grid_index = self._get_index()
         self.objects[key] = Pane(obj)
-        self.param.trigger('objects')
+        if not grid_index.add(key):
+            self._index = None
+        self._trigger_objects()
+
+
+class _GridIndex(object):
+    """
+    Spatial index of the regions occupied by the objects in a GridSpec,
+    recording the number of objects occupying each cell and the key of
+    the object last assigned to each cell. Cells and regions may be
+    looked up and objects added and removed in time proportional to
+    the size of the affected region.
+    """
+
+    def __init__(self, keys, shape=None):
+        keys = list(keys)
+        if shape is None:
+            ys = [y1 for (_, _, y1, _) in keys if y1 is not None]
+            xs = [x1 for (_, _, _, x1) in keys if x1 is not None]
+            shape = (max(ys) if ys else 0, max(xs) if xs else 0)
+        self.nrows, self.ncols = shape
+        self.occupancy = np.zeros(shape, dtype='uint8')
+        self._cells = np.full(shape, -1, dtype='int64')
+        self._codes = OrderedDict()
+        self._lookup = {}
+        # Codes released by removed keys, which are reused first
+        self._free = []
+        for key in keys:
+            self._insert(key)
+
+    def __len__(self):
+        return len(self._codes)
+
+    @property
+    def keys(self):
+        """
+        The indexed keys in the order they were added.
+        """
+        return list(self._codes)
+
+    def _insert(self, key):
+        code = self._free.pop() if self._free else len(self._lookup)
+        self._codes[key] = code
+        self._lookup[code] = key
+        t, l, b, r = self.bounds(key)
+        self.occupancy[t:b, l:r] += 1
+        self._cells[t:b, l:r] = code
+
+    def bounds(self, key):
+        """
+        Returns the (top, left, bottom, right) bounds of the region
+        covered by the key on the grid.
+        """
+        y0, x0, y1, x1 = key
+        return (0 if y0 is None else y0, 0 if x0 is None else x0,
+                self.nrows if y1 is None else y1,
+                self.ncols if x1 is None else x1)
+
+    def fits(self, key):
+        """
+        Whether the key can be added without changing the shape of
+        the grid.
+        """
+        _, _, y1, x1 = key
+        return ((y1 is None or y1 <= self.nrows) and
+                (x1 is None or x1 <= self.ncols))
+
+    def key_at(self, y, x):
+        """
+        Returns the key of the object occupying the cell, if any.
+        """
+        return self._lookup.get(self._cells[y, x])
+
+    def lookup(self, yidx, xidx):
+        """
+        Returns the keys of the objects occupying the cells selected by
+        the (integer or slice) indexes in the order they are first
+        encountered and whether the selection is a single cell.
+        """
+        cells = self._cells[yidx, xidx]
+        if not isinstance(cells, np.ndarray):
+            return ([self._lookup[cells]] if cells >= 0 else []), True
+        codes = OrderedDict.fromkeys(c for c in cells.flatten() if c >= 0)
+        return [self._lookup[c] for c in codes], False
+
+    def add(self, key):
+        """
+        Adds the key to the index, returning False if the index has
+        to be rebuilt because the key changes the shape of the grid.
+        """
+        if not self.fits(key) or key in self._codes:
+            return False
+        self._insert(key)
+        return True
+
+    def remove(self, key):
+        """
+        Removes the key from the index, returning False if the index
+        has to be rebuilt because the key overlapped with other keys
+        or determined the shape of the grid.
+        """
+        code = self._codes.pop(key, None)
+        if code is None:
+            return False
+        del self._lookup[code]
+        _, _, y1, x1 = key
+        if ((y1 is not None and y1 == self.nrows) or
+            (x1 is not None and x1 == self.ncols)):
+            return False
+        t, l, b, r = self.bounds(key)
+        occupancy = self.occupancy[t:b, l:r]
+        if (occupancy > 1).any():
+            return False
+        occupancy -= 1
+        self._cells[t:b, l:r] = -1
+        self._free.append(code)
+        return True
 
 
 class Spacer(Reactive):
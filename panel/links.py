@@ -94,11 +94,32 @@ class Link(param.Parameterized):
             links.pop(links.index(self))
 
     @classmethod
-    def _process_links(cls, root_view, root_model):
+    def _has_links(cls, root_model, changed):
+        """
+        Whether any of the changed Viewables or their models may be the
+        source or target of a Link.
+        """
+        ref = root_model.ref['id']
+        linkable = []
+        for view in changed:
+            linkable += view.select(Viewable)
+            if ref in view._models:
+                linkable += list(view._models[ref][0].select({'type': BkModel}))
+        if any(isinstance(obj, HoloViews) or obj in cls.registry
+               for obj in linkable):
+            return True
+        targets = {id(link.target) for links in cls.registry.values()
+                   for link in links if link.target is not None}
+        return any(id(obj) in targets for obj in linkable)
+
+    @classmethod
+    def _process_links(cls, root_view, root_model, changed=None):
         if not isinstance(root_view, (Panel, CompositeWidget)) or not root_model:
             return
+        elif changed is not None and not cls._has_links(root_model, changed):
+            return
 
-        linkable = root_view.select(Viewable)
+        linkable = root_view._cached_select(Viewable)
         linkable += root_model.select({'type' : BkModel})
 
         if not linkable:
@@ -109,7 +130,7 @@ class Link(param.Parameterized):
                  if link.target in linkable or not link._requires_target]
 
         if 'holoviews' in sys.modules:
-            hv_views = root_view.select(HoloViews)
+            hv_views = root_view._cached_select(HoloViews)
             map_hve_bk = generate_panel_bokeh_map(root_model, hv_views)
             found += [(link, src, tgt) for src in linkable if src in cls.registry
                       for link in cls.registry[src]
@@ -335,4 +356,4 @@ class GenericLinkCallback(LinkCallback):
 
 GenericLink.register_callback(callback=GenericLinkCallback)
 
-Viewable._preprocessing_hooks.append(Link._process_links)
+Viewable._incremental_hooks.append(Link._process_links)
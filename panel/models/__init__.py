@@ -5,6 +5,7 @@ defined as pairs of Python classes and TypeScript models defined in .ts
 files.
 """
 
+from .layout import VirtualColumn # noqa
 from .markup import HTML # noqa
 from .state import State # noqa
 from .widgets import Audio, Player, VideoStream # noqa
@@ -0,0 +1,27 @@
+"""
+Custom bokeh layout models.
+"""
+from __future__ import absolute_import, division, unicode_literals
+
+import os
+
+from bokeh.core.properties import Int
+from bokeh.models import Column
+
+from ..compiler import CUSTOM_MODELS
+
+
+class VirtualColumn(Column):
+    """
+    A bokeh Column which scrolls its contents and reports the index
+    of the first visible child, estimated from the item height.
+    """
+
+    __implementation__ = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'layout.ts')
+
+    item_height = Int(50, help="Estimated height of each child in pixels")
+
+    scroll_index = Int(0, help="Index of the first visible child")
+
+
+CUSTOM_MODELS['panel.models.layout.VirtualColumn'] = VirtualColumn
@@ -0,0 +1,48 @@
+import * as p from "core/properties"
+import {Column, ColumnView} from "models/layouts/column"
+
+export class VirtualColumnView extends ColumnView {
+  model: VirtualColumn
+
+  initialize(): void {
+    super.initialize()
+    this.el.style.overflowY = 'auto'
+    this.el.addEventListener('scroll', () => this.scroll())
+  }
+
+  scroll(): void {
+    // Only report the scroll position when the first visible child changes
+    const index = Math.floor(this.el.scrollTop / this.model.item_height)
+    if (index !== this.model.scroll_index)
+      this.model.scroll_index = index
+  }
+}
+
+export namespace VirtualColumn {
+  export type Attrs = p.AttrsOf<Props>
+  export type Props = Column.Props & {
+    item_height: p.Property<number>
+    scroll_index: p.Property<number>
+  }
+}
+
+export interface VirtualColumn extends VirtualColumn.Attrs {}
+
+export class VirtualColumn extends Column {
+  properties: VirtualColumn.Props
+
+  constructor(attrs?: Partial<VirtualColumn.Attrs>) {
+    super(attrs)
+  }
+
+  static initClass(): void {
+    this.prototype.type = "VirtualColumn"
+    this.prototype.default_view = VirtualColumnView
+
+    this.define<VirtualColumn.Props>({
+      item_height:  [ p.Number, 50 ],
+      scroll_index: [ p.Number, 0  ],
+    })
+  }
+}
+VirtualColumn.initClass()
@@ -25,6 +25,8 @@ class Ace(PaneBase):
 
     readonly = param.Boolean(default=False, doc="Define if editor content can be modified")
 
+    _applies_by_type = True
+
     _updates = True
 
     @classmethod
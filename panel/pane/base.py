@@ -5,12 +5,14 @@ objects to a visual representation expressed as a bokeh model.
 from __future__ import absolute_import, division, unicode_literals
 
 from functools import partial
+from weakref import WeakKeyDictionary
 
 import param
 
 from bokeh.io import curdoc as _curdoc
 
-from ..io import push, state
+from ..io import state
+from ..io.stats import timed_call
 from ..layout import Panel, Row
 from ..viewable import Viewable, Reactive, Layoutable
 from ..util import param_reprs
@@ -25,6 +27,25 @@ def Pane(obj, **kwargs):
     return PaneBase.get_pane_type(obj)(obj, **kwargs)
 
 
+class PaneMeta(param.parameterized.ParameterizedMetaclass):
+    """
+    Metaclass for Pane types which caches the concrete Pane types
+    considered by PaneBase.get_pane_type and the Pane types which were
+    ruled out for each object type. The caches are reset whenever a
+    new Pane type is declared.
+    """
+
+    _pane_types = None
+
+    _excluded = WeakKeyDictionary()
+
+    def __init__(mcs, name, bases, dict_):
+        super(PaneMeta, mcs).__init__(name, bases, dict_)
+        PaneMeta._pane_types = None
+        PaneMeta._excluded = WeakKeyDictionary()
+
+
+@param.parameterized.add_metaclass(PaneMeta)
 class PaneBase(Reactive):
     """
     PaneBase is the abstract baseclass for all atomic displayable units
@@ -56,6 +77,11 @@ class PaneBase(Reactive):
     # Declares whether Pane supports updates to the Bokeh model
     _updates = False
 
+    # Declares whether the applies method only depends on the type of
+    # the object, allowing get_pane_type to skip the Pane for all
+    # objects of a type once it has declared it does not apply
+    _applies_by_type = False
+
     # Whether the Pane layout can be safely unpacked
     _unpack = True
 
@@ -71,9 +97,10 @@ class PaneBase(Reactive):
                              (type(self).__name__, type(object).__name__))
 
         super(PaneBase, self).__init__(object=object, **params)
+        self._rerendering = set()
         kwargs = {k: v for k, v in params.items() if k in Layoutable.param}
         self.layout = self.default_layout(self, **kwargs)
-        self.param.watch(self._update_pane, self._rerender_params)
+        self.param.watch(partial(timed_call, self._update_pane), self._rerender_params)
 
     def __repr__(self, depth=0):
         cls = type(self).__name__
@@ -119,18 +146,31 @@ class PaneBase(Reactive):
         from ..io import state
         ref = root.ref['id']
         if ref in state._views:
-            state._views[ref][0]._preprocess(root)
+            state._views[ref][0]._preprocess(root, [self])
 
     def _update_pane(self, event):
-        for ref, (model, parent) in self._models.items():
+        for ref, (model, parent) in list(self._models.items()):
+            if ref not in state._views:
+                continue
             viewable, root, doc, comm = state._views[ref]
-            if comm or state._unblocked(doc):
+            if doc not in state._held_docs and (comm or state._unblocked(doc)):
                 self._update_object(model, doc, root, parent, comm)
                 if comm and 'embedded' not in root.tags:
-                    push(doc, comm)
-            else:
-                cb = partial(self._update_object, model, doc, root, parent, comm)
-                doc.add_next_tick_callback(cb)
+                    state._schedule_push(doc, comm)
+            elif ref not in self._rerendering:
+                # A single rerender per tick reflects all changes
+                self._rerendering.add(ref)
+                cb = partial(self._rerender, ref, doc, root, parent, comm)
+                state._schedule_update(doc, cb, comm)
+
+    def _rerender(self, ref, doc, root, parent, comm=None):
+        self._rerendering.discard(ref)
+        if ref not in self._models:
+            return
+        model, _ = self._models[ref]
+        self._update_object(model, doc, root, parent, comm)
+        if comm and 'embedded' not in root.tags:
+            state._schedule_push(doc, comm)
 
     def _update(self, model):
         """
@@ -193,8 +233,7 @@ class PaneBase(Reactive):
         else:
             root = self.layout._get_model(doc, comm=comm)
         self._preprocess(root)
-        ref = root.ref['id']
-        state._views[ref] = (self, root, doc, comm)
+        state._register_view(self, root, doc, comm)
         return root
 
     @classmethod
@@ -214,9 +253,23 @@ class PaneBase(Reactive):
         """
         if isinstance(obj, Viewable):
             return type(obj)
+        pane_types = PaneMeta._pane_types
+        if pane_types is None:
+            pane_types = list(param.concrete_descendents(PaneBase).values())
+            PaneMeta._pane_types = pane_types
+        excluded = PaneMeta._excluded.get(type(obj))
+        if excluded is None:
+            excluded = PaneMeta._excluded[type(obj)] = set()
         descendents = []
-        for p in param.concrete_descendents(PaneBase).values():
-            priority = p.applies(obj) if p.priority is None else p.priority
+        for p in pane_types:
+            if p in excluded:
+                continue
+            elif p.priority is None:
+                priority = p.applies(obj)
+                if priority is False and p._applies_by_type:
+                    excluded.add(p)
+            else:
+                priority = p.priority
             if isinstance(priority, bool) and priority:
                 raise ValueError('If a Pane declares no priority '
                                  'the applies method should return a '
@@ -229,6 +282,9 @@ class PaneBase(Reactive):
         pane_types = reversed(sorted(descendents, key=lambda x: x[0]))
         for _, pane_type in pane_types:
             applies = pane_type.applies(obj)
-            if isinstance(applies, bool) and not applies: continue
+            if isinstance(applies, bool) and not applies:
+                if pane_type._applies_by_type:
+                    excluded.add(pane_type)
+                continue
             return pane_type
         raise TypeError('%s type could not be rendered.' % type(obj).__name__)
@@ -12,6 +12,7 @@ import param
 
 from pyviz_comms import JupyterComm
 
+from ..io.cache import render_cache
 from .markup import DivPaneBase
 
 
@@ -77,5 +78,6 @@ class LaTeX(DivPaneBase):
             obj = obj._repr_latex_()
         elif is_sympy_expr(obj):
             import sympy
-            obj = r'$'+sympy.latex(obj)+'$'
+            render = lambda source: r'$'+sympy.latex(obj)+'$'
+            obj = render_cache.render(render, sympy.srepr(obj), 'latex', 'sympy')
         return dict(properties, text=obj)
@@ -67,8 +67,13 @@ class HoloViews(PaneBase):
 
     priority = 0.8
 
+    _applies_by_type = True
+
     _rerender_params = ['object', 'backend']
 
+    # Plots are rendered for each view
+    _prototype_safe = False
+
     _panes = {'bokeh': Bokeh, 'matplotlib': Matplotlib, 'plotly': Plotly}
 
     _rename = {'backend': None, 'widget_type': None, 'widgets': None,
@@ -414,15 +419,16 @@ def generate_panel_bokeh_map(root_model, panel_views):
     return map_hve_bk
 
 
-def find_links(root_view, root_model):
+def find_links(root_view, root_model, changed=None):
     """
     Traverses the supplied Viewable searching for Links between any
-    HoloViews based panes.
+    HoloViews based panes. Skipped if none of the changed Viewables
+    contain a HoloViews pane.
     """
-    if not isinstance(root_view, Panel):
+    if not isinstance(root_view, Panel) or not _has_holoviews(changed):
         return
 
-    hv_views = root_view.select(HoloViews)
+    hv_views = root_view._cached_select(HoloViews)
     root_plots = [plot for view in hv_views for plot, _ in view._plots.values()
                   if getattr(plot, 'root', None) is root_model]
 
@@ -466,12 +472,16 @@ def find_links(root_view, root_model):
     return callbacks
 
 
-def link_axes(root_view, root_model):
+def link_axes(root_view, root_model, changed=None):
     """
     Pre-processing hook to allow linking axes across HoloViews bokeh
-    plots.
+    plots. Skipped if none of the changed Viewables contain a
+    HoloViews pane.
     """
-    panes = root_view.select(HoloViews)
+    if not _has_holoviews(changed):
+        return
+
+    panes = root_view._cached_select(HoloViews)
 
     if not panes:
         return
@@ -511,5 +521,13 @@ def link_axes(root_view, root_model):
                 fig.y_range = axis
                 p.handles['y_range'] = axis
 
-Viewable._preprocessing_hooks.append(link_axes)
-Viewable._preprocessing_hooks.append(find_links)
+def _has_holoviews(changed):
+    """
+    Whether the changed Viewables (None if the whole tree changed)
+    may contain HoloViews panes.
+    """
+    return changed is None or any(view.select(HoloViews) for view in changed)
+
+
+Viewable._incremental_hooks.append(link_axes)
+Viewable._incremental_hooks.append(find_links)
@@ -7,11 +7,17 @@ from __future__ import absolute_import, division, unicode_literals
 import base64
 import os
 
+from functools import partial
 from io import BytesIO
 from six import string_types
 
 import param
 
+from ..config import config
+from ..io.cache import content_store
+from ..io.fetch import fetcher
+from ..io.state import state, _running_loop
+from ..io.stats import timed_call
 from .markup import DivPaneBase
 
 
@@ -36,6 +42,25 @@ class ImageBase(DivPaneBase):
 
     __abstract = True
 
+    # Whether the image is rendered on a thread pool while serving
+    # from a running IOLoop, e.g. because rendering it is slow
+    _async_render = False
+
+    # Thread pool images are rendered on if no threads are configured
+    _render_executor = None
+
+    # Rendered and served content is tracked per view
+    _prototype_safe = False
+
+    def __init__(self, object=None, **params):
+        super(ImageBase, self).__init__(object=object, **params)
+        self._generation = 0
+        self._fetched = None
+        self._fetching = None
+        self._rendered = None
+        self._rendering = None
+        self._content_key = None
+
     @classmethod
     def applies(cls, obj):
         imgtype = cls.imgtype
@@ -50,26 +75,187 @@ class ImageBase(DivPaneBase):
                 (obj.startswith('http://') or obj.startswith('https://'))
                 and obj.endswith('.'+cls.imgtype))
 
+    @classmethod
+    def _render_pool(cls):
+        """
+        The thread pool images are rendered on asynchronously. If
+        threads are configured (see config.nthreads) images are
+        rendered on the thread pool events are processed on, if
+        threading is disabled by setting config.nthreads to zero
+        None is returned and images are rendered synchronously and
+        otherwise a small dedicated thread pool is used.
+        """
+        nthreads = config.nthreads
+        if nthreads == 0:
+            return None
+        elif nthreads:
+            return state._thread_pool
+        if ImageBase._render_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            ImageBase._render_executor = ThreadPoolExecutor(max_workers=2)
+        return ImageBase._render_executor
+
+    def _update_pane(self, event):
+        if event is not None:
+            self._generation += 1
+            if event.name == 'object':
+                # Refetch remote images when the object is (re)triggered
+                self._fetched = None
+                self._fetching = None
+        super(ImageBase, self)._update_pane(event)
+
     def _img(self):
         if not isinstance(self.object, string_types):
             return getattr(self.object, '_repr_'+self.imgtype+'_')()
         elif os.path.isfile(self.object):
             with open(self.object, 'rb') as f:
                 return f.read()
+        elif self._fetched and self._fetched[0] == self.object:
+            return self._fetched[1]
         else:
-            import requests
-            r = requests.request(url=self.object, method='GET')
-            return r.content
+            data = fetcher.fetch(self.object)
+            self._fetched = (self.object, data)
+            return data
+
+    def _get_img(self, comm=None):
+        """
+        Returns the image data. While serving from a running IOLoop
+        remote images are fetched and, unless threading is disabled
+        (see config.nthreads), slow images (see _async_render) are
+        rendered on a thread, rerendering the pane once the data
+        arrives. Until then the previous data, if any, or otherwise
+        None is returned.
+        """
+        loop = None if comm is not None or config.embed else _running_loop()
+        if loop is None:
+            return self._img()
+        elif self._is_url(self.object):
+            return self._fetch(self.object, loop)
+        elif self._async_render:
+            return self._render(loop)
+        return self._img()
+
+    def _fetch(self, url, loop):
+        if self._fetched and self._fetched[0] == url:
+            return self._fetched[1]
+        if self._fetching != url:
+            self._fetching = url
+            future = fetcher.fetch_async(url)
+            loop.add_future(future, partial(self._fetch_done, url))
+        return fetcher.cached(url)[0]
+
+    def _fetch_done(self, url, future):
+        if self._fetching != url:
+            return # Superseded by a newer object
+        self._fetching = None
+        try:
+            data = future.result()
+        except Exception as e:
+            self.param.warning('Fetching %s failed: %s' % (url, e))
+            return
+        self._fetched = (url, data)
+        timed_call(self._update_pane, None)
+
+    def _render(self, loop):
+        pool = self._render_pool()
+        if pool is None:
+            return self._img()
+        generation = self._generation
+        if self._rendered and self._rendered[0] == generation:
+            return self._rendered[1]
+        if self._rendering is None or self._rendering[0] != generation:
+            if self._rendering is not None:
+                self._rendering[1].cancel()
+            future = pool.submit(self._img)
+            self._rendering = (generation, future)
+            loop.add_future(future, partial(self._render_done, generation))
+        return self._rendered[1] if self._rendered else None
+
+    def _render_done(self, generation, future):
+        if future.cancelled() or generation != self._generation:
+            return # Superseded by a newer object or parameter change
+        self._rendering = None
+        try:
+            data = future.result()
+        except Exception as e:
+            self.param.warning('Rendering %s failed: %s' % (type(self).__name__, e))
+            return
+        self._rendered = (generation, data)
+        timed_call(self._update_pane, None)
 
     def _imgshape(self, data):
         """Calculate and return image width,height"""
         raise NotImplementedError
 
-    def _get_properties(self):
+    def _content_url(self, comm, doc=None):
+        """
+        Returns the URL image data is served on or None if the image
+        should be inlined as base64, i.e. when rendering to a comm
+        (including static save() output), when embedding or if the
+        Document does not belong to a session of a server serving
+        the content store.
+        """
+        if comm is not None or config.embed or doc is None:
+            return None
+        return state._content_urls.get(doc)
+
+    def _src(self, data, mimetype, content_url=None):
+        """
+        Returns the src of the <img> tag, either a URL the image data
+        is served on or the base64 encoded data. Content served from
+        the content store is pinned until the models of the pane are
+        cleaned up or display other content, falling back to base64
+        if the content does not fit in the store.
+        """
+        key = None if content_url is None else content_store.add(data, mimetype)
+        if key is not None and key != self._content_key:
+            if content_store.pin(key):
+                self._unpin_content()
+                self._content_key = key
+            else:
+                key = None
+        if key is not None:
+            return content_url + key
+        b64 = base64.b64encode(data).decode("utf-8")
+        return "data:{mime};base64,{b64}".format(mime=mimetype, b64=b64)
+
+    def _unpin_content(self):
+        if self._content_key is not None:
+            content_store.unpin(self._content_key)
+            self._content_key = None
+
+    def _get_model(self, doc, root=None, parent=None, comm=None):
+        model = self._bokeh_model(**self._get_properties(comm, doc))
+        if root is None:
+            root = model
+        self._models[root.ref['id']] = (model, parent)
+        return model
+
+    def _update(self, model):
+        comm, doc = None, None
+        for ref, (m, _) in self._models.items():
+            if m is model and ref in state._views:
+                doc, comm = state._views[ref][2:]
+                break
+        model.update(**self._get_properties(comm, doc))
+
+    def _cleanup(self, root):
+        super(ImageBase, self)._cleanup(root)
+        if not self._models:
+            self._unpin_content()
+
+    def _get_properties(self, comm=None, doc=None):
         p = super(ImageBase, self)._get_properties()
         if self.object is None:
             return dict(p, text='<img></img>')
-        data = self._img()
+        is_url = self._is_url(self.object)
+        if (is_url and not self.embed and self.width is not None and
+            self.height is not None):
+            # The image data is not needed to determine the shape
+            return self._img_properties(p, self.object, self.width, self.height)
+        data = self._get_img(comm)
+        if data is None:
+            return dict(p, text='<img></img>')
         if not isinstance(data, bytes):
             data = base64.b64decode(data)
         width, height = self._imgshape(data)
@@ -82,12 +268,17 @@ class ImageBase(DivPaneBase):
         elif self.height is not None:
             width = int((self.height/height)*width)
             height = self.height
-        if self._is_url(self.object) and not self.embed:
+        if is_url and not self.embed:
             src = self.object
         else:
-            b64 = base64.b64encode(data).decode("utf-8")
-            src = "data:image/"+self.imgtype+";base64,{b64}".format(b64=b64)
-
+            src = self._src(data, 'image/'+self.imgtype, self._content_url(comm, doc))
+        return self._img_properties(p, src, width, height)
+
+    def _img_properties(self, p, src, width, height):
+        """
+        Returns the properties of a Div displaying an <img> tag with
+        the supplied src sized according to the sizing_mode.
+        """
         smode = self.sizing_mode
         if smode in ['fixed', None]:
             w, h = '%spx' % width, '%spx' % height
@@ -171,16 +362,17 @@ class SVG(ImageBase):
     def _imgshape(self, data):
         return (self.width, self.height)
 
-    def _get_properties(self):
+    def _get_properties(self, comm=None, doc=None):
         p = super(ImageBase, self)._get_properties()
         if self.object is None:
             return dict(p, text='<img></img>')
-        data = self._img()
+        data = self._get_img(comm)
+        if data is None:
+            return dict(p, text='<img></img>')
         width, height = self._imgshape(data)
         if not isinstance(data, bytes):
             data = data.encode('utf-8')
-        b64 = base64.b64encode(data).decode("utf-8")
-        src = "data:image/svg+xml;base64,{b64}".format(b64=b64)
+        src = self._src(data, 'image/svg+xml', self._content_url(comm, doc))
         html = "<img src='{src}' width={width} height={height}></img>".format(
             src=src, width=width, height=height
         )
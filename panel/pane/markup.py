@@ -14,6 +14,7 @@ import param
 
 from bokeh.models import Div as _BkDiv
 
+from ..io.cache import render_cache
 from ..viewable import Layoutable
 from ..models import HTML as _BkHTML
 from .base import PaneBase
@@ -85,10 +86,38 @@ class HTML(DivPaneBase):
         properties = super(HTML, self)._get_properties()
         text = '' if self.object is None else self.object
         if hasattr(text, 'to_html') and any(text.__module__ for m in ('pandas', 'dask')):
-            text = text.to_html(classes=['panel-df']).replace('border="1"', '')
-        elif hasattr(text, '_repr_html_'):
-            text = text._repr_html_()
-        return dict(properties, text=escape(text))
+            source = self._hash_frame(text)
+            render = lambda source: escape(self._render_frame(text))
+            if source is None:
+                text = render(source)
+            else:
+                text = render_cache.render(render, source, 'html', 'frame')
+        else:
+            if hasattr(text, '_repr_html_'):
+                text = text._repr_html_()
+            text = escape(text)
+        return dict(properties, text=text)
+
+    @classmethod
+    def _hash_frame(cls, df):
+        """
+        Returns bytes uniquely identifying the contents of a pandas
+        DataFrame or Series, or None if the object cannot be hashed
+        without computing it (e.g. a dask DataFrame).
+        """
+        if not type(df).__module__.startswith('pandas'):
+            return None
+        import pandas as pd
+        try:
+            hashed = pd.util.hash_pandas_object(df, index=True).values
+        except TypeError:
+            return None
+        columns = list(df.columns) if hasattr(df, 'columns') else [df.name]
+        return repr((type(df).__name__, columns)).encode('utf-8') + hashed.tobytes()
+
+    @classmethod
+    def _render_frame(cls, df):
+        return df.to_html(classes=['panel-df']).replace('border="1"', '')
 
 
 class Str(DivPaneBase):
@@ -126,6 +155,8 @@ class Markdown(DivPaneBase):
     # Priority depends on the data type
     priority = None
 
+    _extensions = ('markdown.extensions.extra', 'markdown.extensions.smarty')
+
     @classmethod
     def applies(cls, obj):
         if hasattr(obj, '_repr_markdown_'):
@@ -136,7 +167,6 @@ class Markdown(DivPaneBase):
             return False
 
     def _get_properties(self):
-        import markdown
         data = self.object
         if data is None:
             data = ''
@@ -144,6 +174,12 @@ class Markdown(DivPaneBase):
             data = data._repr_markdown_()
         properties = super(Markdown, self)._get_properties()
         properties['style'] = properties.get('style', {})
-        extensions = ['markdown.extensions.extra', 'markdown.extensions.smarty']
-        html = markdown.markdown(data, extensions=extensions, output_format='html5')
+        html = render_cache.render(self._render, data, 'markdown',
+                                   *self._extensions)
         return dict(properties, text=html)
+
+    @classmethod
+    def _render(cls, data):
+        import markdown
+        return markdown.markdown(data, extensions=list(cls._extensions),
+                                 output_format='html5')
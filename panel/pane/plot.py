@@ -4,6 +4,8 @@ Pane class which render plots from different libraries
 from __future__ import absolute_import, division, unicode_literals
 
 import sys
+import threading
+import weakref
 
 from io import BytesIO
 
@@ -24,6 +26,8 @@ class Bokeh(PaneBase):
 
     priority = 0.8
 
+    _applies_by_type = True
+
     @classmethod
     def applies(cls, obj):
         return isinstance(obj, LayoutDOM)
@@ -63,8 +67,18 @@ class Matplotlib(PNG):
         Automatically adjust the figure size to fit the
         subplots and other artist elements.""")
 
+    _applies_by_type = True
+
+    _async_render = True
+
     _rerender_params = ['object', 'dpi']
 
+    # Renders of a figure mutate it, so renders of the same figure
+    # on different threads are serialised
+    _figure_locks = weakref.WeakKeyDictionary()
+
+    _figure_locks_lock = threading.Lock()
+
     @classmethod
     def applies(cls, obj):
         if 'matplotlib' not in sys.modules:
@@ -81,8 +95,15 @@ class Matplotlib(PNG):
         w, h = self.object.get_size_inches()
         return int(w*72), int(h*72)
 
+    def _figure_lock(self, fig):
+        with self._figure_locks_lock:
+            lock = self._figure_locks.get(fig)
+            if lock is None:
+                lock = self._figure_locks[fig] = threading.Lock()
+        return lock
+
     def _img(self):
-        self.object.set_dpi(self.dpi)
+        fig = self.object
         b = BytesIO()
 
         if self.tight:
@@ -90,7 +111,9 @@ class Matplotlib(PNG):
         else:
             bbox_inches = None
 
-        self.object.canvas.print_figure(b, bbox_inches=bbox_inches)
+        with self._figure_lock(fig):
+            fig.set_dpi(self.dpi)
+            fig.canvas.print_figure(b, bbox_inches=bbox_inches)
         return b.getvalue()
 
 
@@ -106,8 +129,13 @@ class RGGPlot(PNG):
 
     dpi = param.Integer(default=144, bounds=(1, None))
 
+    _async_render = True
+
     _rerender_params = ['object', 'dpi', 'width', 'height']
 
+    # R is not thread safe so plots are rendered one at a time
+    _render_lock = threading.Lock()
+
     @classmethod
     def applies(cls, obj):
         return type(obj).__name__ == 'GGPlot' and hasattr(obj, 'r_repr')
@@ -115,7 +143,7 @@ class RGGPlot(PNG):
     def _img(self):
         from rpy2.robjects.lib import grdevices
         from rpy2 import robjects
-        with grdevices.render_to_bytesio(grdevices.png,
+        with self._render_lock, grdevices.render_to_bytesio(grdevices.png,
                  type="cairo-png", width=self.width, height=self.height,
                  res=self.dpi, antialias="subpixel") as b:
             robjects.r("print")(self.object)
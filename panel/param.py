@@ -12,6 +12,7 @@ import inspect
 import itertools
 
 from collections import OrderedDict, namedtuple
+from functools import partial
 from six import string_types
 
 import param
@@ -20,6 +21,7 @@ from bokeh.io import curdoc as _curdoc
 from param.parameterized import classlist
 
 from .io import state
+from .io.stats import timed_call
 from .layout import Row, Panel, Tabs, Column
 from .links import Link
 from .pane.base import Pane, PaneBase
@@ -503,7 +505,7 @@ class Param(PaneBase):
         root = self.layout.get_root(doc, comm)
         ref = root.ref['id']
         self._models[ref] = (root, None)
-        state._views[ref] = (self, root, doc, comm)
+        state._register_view(self, root, doc, comm)
         return root
 
 
@@ -562,6 +564,7 @@ class ParamMethod(PaneBase):
             kwargs = dict(self.get_param_values(), **self._kwargs)
             del kwargs['object']
             self._pane = Pane(new_object, **kwargs)
+            self._invalidate_selections()
             self._inner_layout[0] = self._pane
 
     def _link_object_params(self):
@@ -617,24 +620,13 @@ class ParamMethod(PaneBase):
         self._models[ref] = (model, parent)
         return model
 
-    def select(self, selector=None):
-        """
-        Iterates over the Viewable and any potential children in the
-        applying the Selector.
-
-        Arguments
-        ---------
-        selector: type or callable or None
-          The selector allows selecting a subset of Viewables by
-          declaring a type or callable function to filter by.
+    def _selection_version(self):
+        return self._children_version
 
-        Returns
-        -------
-        viewables: list(Viewable)
-        """
-        selected = super(ParamMethod, self).select(selector)
-        selected += self._pane.select(selector)
-        return selected
+    def _traverse(self):
+        yield self
+        for child in self._pane._traverse():
+            yield child
 
     def _cleanup(self, root=None):
         self._inner_layout._cleanup(root)
@@ -662,7 +654,7 @@ class ParamFunction(ParamMethod):
         deps = self.object._dinfo
         dep_params = list(deps['dependencies']) + list(deps.get('kw', {}).values())
         for p in dep_params:
-            watcher = p.owner.param.watch(self._update_pane, p.name)
+            watcher = p.owner.param.watch(partial(timed_call, self._update_pane), p.name)
             self._callbacks.append(watcher)
 
     #----------------------------------------------------------------
@@ -6,6 +6,7 @@ import param
 
 from panel.interact import interactive
 from panel.pane import Pane, PaneBase, Bokeh, HoloViews
+from panel.pane.base import PaneMeta
 from panel.param import ParamMethod
 from panel._testing.util import check_layoutable_properties
 
@@ -34,3 +35,28 @@ def test_pane_clone(pane):
     assert ([(k, v) for k, v in sorted(p.param.get_param_values()) if k != 'name'] ==
             [(k, v) for k, v in sorted(clone.param.get_param_values()) if k != 'name'])
 
+
+
+def test_pane_type_excluded_by_type():
+    assert PaneBase.get_pane_type(1) is not Bokeh
+    assert Bokeh in PaneMeta._excluded[int]
+    assert PaneBase.get_pane_type(2) is not Bokeh
+
+
+def test_pane_type_cache_reset_on_new_pane_type():
+    class CustomObject(object):
+        pass
+
+    assert PaneBase.get_pane_type(CustomObject()) is not Bokeh
+    assert PaneMeta._pane_types is not None
+
+    class CustomPane(PaneBase):
+
+        priority = 1
+
+        @classmethod
+        def applies(cls, obj):
+            return isinstance(obj, CustomObject)
+
+    assert PaneMeta._pane_types is None
+    assert PaneBase.get_pane_type(CustomObject()) is CustomPane
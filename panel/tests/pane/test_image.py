@@ -53,3 +53,45 @@ def test_imgshape():
         w,h = t._imgshape(b64decode(twopixel[t.name.lower()]))
         assert w == 2
         assert h == 1
+
+
+def test_png_pane_served_from_content_store(document, comm, tmpdir):
+    from panel.io.cache import content_store
+    from panel.io.state import state
+    data = b64decode(twopixel['png'])
+    path = tmpdir.join('image.png')
+    path.write_binary(data)
+    pane = PNG(str(path))
+    state._content_urls[document] = '/panel/content/'
+    try:
+        model = pane.get_root(document)
+        comm_model = pane.get_root(document, comm=comm)
+    finally:
+        del state._content_urls[document]
+    assert "src='/panel/content/" in model.text
+    key = model.text.split('/panel/content/')[1].split("'")[0]
+    assert content_store.get(key) == (data, 'image/png')
+    assert twopixel['png'].decode('utf-8') in comm_model.text
+
+    # Content stays pinned until the last model is cleaned up
+    pins = content_store._pins[key]
+    pane._cleanup(comm_model)
+    assert content_store._pins[key] == pins
+    pane._cleanup(model)
+    assert content_store._pins.get(key, 0) == pins-1
+    assert pane._content_key is None
+
+
+def test_png_pane_inlined_outside_server_session(document, tmpdir):
+    path = tmpdir.join('image.png')
+    path.write_binary(b64decode(twopixel['png']))
+    model = PNG(str(path)).get_root(document)
+    assert 'data:image/png;base64,' in model.text
+
+
+def test_png_pane_refetches_url_when_object_triggered():
+    url = 'https://example.com/image.png'
+    pane = PNG(url)
+    pane._fetched = (url, b64decode(twopixel['png']))
+    pane.param.trigger('object')
+    assert pane._fetched is None
@@ -59,3 +59,30 @@ def test_string_pane(document, comm):
     # Cleanup
     pane._cleanup(model)
     assert pane._models == {}
+
+
+def test_markdown_pane_render_cached(document, comm):
+    from panel.io.cache import render_cache
+    render_cache.clear()
+    pane = Markdown("**Cached**")
+    model = pane.get_root(document, comm=comm)
+    assert len(render_cache) == 1
+
+    other = Markdown("**Cached**")
+    other_model = other.get_root(document, comm=comm)
+    assert len(render_cache) == 1
+    assert other_model.text == model.text
+
+
+def test_html_pane_dataframe_render_cached(document, comm):
+    import pandas as pd
+    from panel.io.cache import render_cache
+    render_cache.clear()
+    df = pd.DataFrame({'a': [1, 2, 3]})
+    pane = HTML(df)
+    model = pane.get_root(document, comm=comm)
+    assert len(render_cache) == 1
+
+    pane.object = pd.DataFrame({'a': [1, 2, 4]})
+    assert len(render_cache) == 2
+    assert model.text != HTML(df).get_root(document, comm=comm).text
@@ -61,3 +61,60 @@ def test_matplotlib_pane(document, comm):
     assert pane._models == {}
 
 
+@mpl_available
+def test_matplotlib_pane_async_render_drops_stale_results(document, monkeypatch):
+    from concurrent.futures import Future
+    from panel.io.state import state
+    from panel.pane import image
+
+    class Loop(object):
+        def __init__(self):
+            self.futures = []
+        def add_future(self, future, callback):
+            self.futures.append((future, callback))
+
+    class Pool(object):
+        # Renders are only run when the test resolves their futures
+        def __init__(self):
+            self.submitted = []
+        def submit(self, fn):
+            future = Future()
+            self.submitted.append((future, fn))
+            return future
+
+    loop, pool = Loop(), Pool()
+    monkeypatch.setattr(image, '_running_loop', lambda: loop)
+    monkeypatch.setattr(Matplotlib, '_render_pool', classmethod(lambda cls: pool))
+    # Image data is inlined unless the Document belongs to a server
+    monkeypatch.setattr(state, '_content_urls', {})
+
+    pane = Matplotlib(mpl_figure())
+    model = pane.get_root(document)
+    assert model.text == '<img></img>'
+
+    # Changing the dpi cancels the pending render
+    pane.dpi = 72
+    state._flush_updates(document)
+    (stale, _), (current, render) = pool.submitted
+    assert stale.cancelled()
+    assert model.text == '<img></img>'
+
+    # The callback of the stale render is dropped
+    loop.futures[0][1](stale)
+    assert pane._rendered is None
+
+    current.set_result(render())
+    loop.futures[1][1](current)
+    state._flush_updates(document)
+    assert 'data:image/png;base64' in model.text
+
+
+def test_matplotlib_pane_render_pool_follows_nthreads():
+    from panel.config import config
+    from panel.io.state import state
+
+    assert Matplotlib._render_pool() is not None
+    with config.set(nthreads=0):
+        assert Matplotlib._render_pool() is None
+    with config.set(nthreads=2):
+        assert Matplotlib._render_pool() is state._thread_pool
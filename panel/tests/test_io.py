@@ -127,3 +127,224 @@ def test_save_embed_json(tmpdir):
         assert event['kind'] == 'ModelChanged'
         assert event['attr'] == 'text'
         assert event['new'] == '<pre>%s</pre>' % v
+
+
+def test_views_evicted_on_session_destroyed():
+    from bokeh.document import Document
+    from panel.io.state import state
+
+    class SessionContext(object):
+        def __init__(self, doc):
+            self._document = doc
+
+    doc = Document()
+    widget = FloatSlider()
+    row = Row(widget)
+    model = row.get_root(doc)
+    ref = model.ref['id']
+    assert state._views[ref] == (row, model, doc, None)
+    assert state._views.models(widget, doc) == [widget._models[ref]]
+
+    for cb in doc.session_destroyed_callbacks:
+        cb(SessionContext(doc))
+
+    assert ref not in state._views
+    assert doc not in state._views.documents()
+    assert widget._models == {}
+
+
+def test_views_held_until_notebook_cleanup(document, comm):
+    import gc
+    from panel.config import _cleanup_panel
+    from panel.io.state import state
+
+    widget = FloatSlider()
+    model = Row(widget).get_root(document, comm)
+    ref = model.ref['id']
+
+    # Transient layouts stay registered so changes are still pushed
+    gc.collect()
+    assert ref in state._views
+    widget.value = 0.5
+    assert model.children[0].value == 0.5
+
+    _cleanup_panel(ref)
+    assert ref not in state._views
+    assert widget._models == {}
+
+
+def test_stats_record_per_class_and_session(document, comm):
+    from panel.io.state import state
+
+    slider = FloatSlider()
+    row = Row(slider)
+    row.get_root(document, comm)
+
+    state.stats.reset()
+    with state.stats.record():
+        slider.value = 0.5
+    slider.value = 0.2
+
+    summary = state.stats.summary()
+    assert summary['_process_param_change']['FloatSlider']['count'] == 1
+    assert summary['_update_model']['FloatSlider']['count'] == 1
+    assert summary['push'][None]['count'] == 1
+    assert list(state.stats.summary('session')['_update_model']) == [None]
+    assert json.loads(state.stats.to_json(by=None))['_update_model']['count'] == 1
+    state.stats.reset()
+
+
+def test_render_cache_evicts_least_recently_used():
+    from panel.io.cache import RenderCache
+    cache = RenderCache(max_bytes=250)
+    keys = [RenderCache.key('source %d' % i) for i in range(3)]
+    for key in keys:
+        cache.put(key, 'x'*60)
+    assert keys[0] not in cache
+    assert cache.get(keys[1]) is not None
+    cache.put(RenderCache.key('source 3'), 'x'*60)
+    assert keys[1] in cache
+    assert keys[2] not in cache
+    assert cache.nbytes <= 250
+
+
+def test_render_cache_disabled():
+    from panel.io.cache import RenderCache
+    cache = RenderCache(max_bytes=0)
+    calls = []
+    render = lambda source: calls.append(source) or source
+    cache.render(render, 'a')
+    cache.render(render, 'a')
+    assert len(calls) == 2
+    assert len(cache) == 0
+
+
+def test_content_store_does_not_evict_pinned_content():
+    from panel.io.cache import ContentStore
+    store = ContentStore(max_bytes=100)
+    key = store.add(b'a'*60, 'image/png')
+    assert store.pin(key)
+    assert store.add(b'b'*60, 'image/png') is None
+    assert key in store
+    store.unpin(key)
+    assert key in store
+    other = store.add(b'b'*60, 'image/png')
+    assert other is not None
+    assert key not in store
+
+
+def test_fetcher_conditional_requests_and_disk_cache(tmpdir):
+    import threading
+    from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from panel.io.fetch import Fetcher
+
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(self.headers.get('If-None-Match'))
+            if self.headers.get('If-None-Match') == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('ETag', '"v1"')
+            self.send_header('Content-Length', '5')
+            self.end_headers()
+            self.wfile.write(b'image')
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('localhost', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    url = 'http://localhost:%d/img.png' % server.server_port
+    try:
+        fetcher = Fetcher(cache_dir=str(tmpdir), max_bytes=1024)
+        assert fetcher.fetch(url) == b'image'
+        assert fetcher.fetch(url) == b'image'
+        assert requests == [None, '"v1"']
+
+        # A new fetcher revalidates the content cached on disk
+        other = Fetcher(cache_dir=str(tmpdir), max_bytes=1024)
+        assert other.cached(url)[0] == b'image'
+        assert other.fetch_async(url).result() == b'image'
+        assert requests == [None, '"v1"', '"v1"']
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_fetcher_evicts_least_recently_used(tmpdir):
+    from panel.io.fetch import Fetcher
+    # Each entry occupies 8 bytes, the content and a 3 byte header
+    fetcher = Fetcher(cache_dir=str(tmpdir), max_bytes=20)
+    for i, url in enumerate(['http://a', 'http://b']):
+        fetcher._store(url, url[-1].encode('utf-8')*5, {})
+        os.utime(fetcher._path(url), (i, i))
+    fetcher._store('http://c', b'ccccc', {})
+    assert fetcher.cached('http://a')[0] is None
+    assert fetcher.cached('http://b')[0] == b'bbbbb'
+    assert fetcher.cached('http://c')[0] == b'ccccc'
+    assert not [f for f in os.listdir(str(tmpdir)) if f.endswith('.tmp')]
+
+
+def test_fetcher_does_not_cache_in_shared_dir(tmpdir):
+    from panel.io.fetch import Fetcher
+    cache_dir = tmpdir.mkdir('shared')
+    cache_dir.chmod(0o777)
+    fetcher = Fetcher(cache_dir=str(cache_dir), max_bytes=20)
+    fetcher._store('http://a', b'aaaaa', {})
+    assert fetcher.cached('http://a')[0] is None
+
+
+def test_pending_updates_released_on_session_destroyed():
+    from bokeh.document import Document
+    from panel.io.state import state
+
+    class SessionContext(object):
+        def __init__(self, doc):
+            self._document = doc
+
+    doc = Document()
+    doc._session_context = lambda: SessionContext(doc)
+    state._schedule_update(doc, lambda: None)
+    assert doc in state._pending_updates
+
+    for cb in doc.session_destroyed_callbacks:
+        cb(SessionContext(doc))
+    assert doc not in state._pending_updates
+
+
+def test_failing_update_does_not_drop_pending_updates():
+    from bokeh.document import Document
+    from panel.io.state import state
+
+    def fail():
+        raise ValueError('failed')
+
+    doc = Document()
+    applied = []
+    state._schedule_update(doc, fail)
+    state._schedule_update(doc, lambda: applied.append(1))
+    state._flush_updates(doc)
+    assert applied == [1]
+    assert doc not in state._pending_updates
+
+
+def test_stats_record_subclass_overrides(document, comm):
+    from panel.io.state import state
+    from panel.widgets import Select
+
+    select = Select(options=['A', 'B'])
+    select.get_root(document, comm)
+
+    state.stats.reset()
+    with state.stats.record():
+        select.value = 'B'
+
+    summary = state.stats.summary()
+    assert summary['_process_param_change']['Select']['count'] == 1
+    state.stats.reset()
@@ -2,9 +2,11 @@ from __future__ import absolute_import
 
 import pytest
 
+from collections import OrderedDict
+
 from bokeh.models import (Div, Row as BkRow, Tabs as BkTabs,
                           Column as BkColumn, Panel as BkPanel)
-from panel.layout import Column, Row, Tabs, Spacer, GridSpec, WidgetBox
+from panel.layout import Column, Row, Tabs, Spacer, GridSpec, WidgetBox, VirtualColumn
 from panel.pane import Bokeh, Pane
 from panel.param import Param
 from panel._testing.util import check_layoutable_properties
@@ -98,6 +100,40 @@ def test_layout_select_by_function(panel):
     assert panes[0].object is div2
 
 
+def test_layout_select_nested_order():
+    div1, div2, div3 = Div(), Div(), Div()
+    inner = Row(div2, div3)
+    layout = Column(div1, inner)
+
+    assert layout.select() == [layout, layout[0], inner, inner[0], inner[1]]
+    assert [p.object for p in layout.select(Bokeh)] == [div1, div2, div3]
+
+
+def test_layout_cached_select_invalidated_on_objects_change():
+    div1, div2, div3 = Div(), Div(), Div()
+    inner = Row(div2)
+    layout = Column(div1, inner)
+
+    panes = layout._cached_select(Bokeh)
+    assert [p.object for p in panes] == [div1, div2]
+    assert layout._selection_index[1][Bokeh] == panes
+
+    inner.append(div3)
+    panes = layout._cached_select(Bokeh)
+    assert [p.object for p in panes] == [div1, div2, div3]
+
+
+def test_layout_cached_select_unaffected_by_other_trees():
+    layout = Column(Div(), Row(Div()))
+    other = Row(Div())
+
+    selections = layout._cached_select(Bokeh)
+    index = layout._selection_index
+    other.append(Div())
+    assert layout._cached_select(Bokeh) == selections
+    assert layout._selection_index is index
+
+
 @pytest.mark.parametrize(['panel', 'model_type'], [(Column, BkColumn), (Row, BkRow)])
 def test_layoutget_root(panel, model_type, document, comm):
     div1 = Div()
@@ -405,6 +441,22 @@ def test_tabs_constructor_with_named_objects(document, comm):
     assert tab2.child is div2
 
 
+def test_tabs_names_updated_once_before_models(document, comm):
+    calls = []
+
+    class CountingTabs(Tabs):
+        def _update_names(self, event):
+            calls.append(event)
+            super(CountingTabs, self)._update_names(event)
+
+    div1, div2 = Div(), Div()
+    tabs = CountingTabs(('A', div1))
+    model = tabs.get_root(document, comm=comm)
+    tabs.objects = tabs.objects + [Bokeh(div2, name='B')]
+    assert len(calls) == 1
+    assert [p.title for p in model.tabs] == ['A', 'B']
+
+
 def test_tabs_set_panes(document, comm):
     div1, div2 = Div(), Div()
     p1 = Pane(div1, name='Div1')
@@ -837,6 +889,96 @@ def test_tabs_clear(document, comm):
     assert p1._models == p2._models == {}
 
 
+def test_tabs_reorder_reuses_tab_models(document, comm):
+    div1, div2 = Div(), Div()
+    tabs = Tabs(('A', div1), ('B', div2))
+    model = tabs.get_root(document, comm=comm)
+    tab1, tab2 = model.tabs
+
+    tabs[:] = [('B', div2), ('A', div1)]
+    assert model.tabs[0] is tab2
+    assert model.tabs[1] is tab1
+
+
+def test_tabs_dynamic_renders_active_tab(document, comm):
+    div1, div2 = Div(), Div()
+    tabs = Tabs(('A', div1), ('B', div2), dynamic=True)
+    model = tabs.get_root(document, comm=comm)
+    tab1, tab2 = model.tabs
+
+    assert tab1.child is div1
+    assert 'dynamic-placeholder' in tab2.child.tags
+    assert model.ref['id'] not in tabs[1]._models
+
+
+def test_tabs_dynamic_renders_tab_on_select(document, comm):
+    div1, div2 = Div(), Div()
+    tabs = Tabs(('A', div1), ('B', div2), dynamic=True)
+    model = tabs.get_root(document, comm=comm)
+    tab1, tab2 = model.tabs
+
+    tabs.active = 1
+    assert model.tabs[1] is tab2
+    assert tab2.child is div2
+
+    # Rendered tabs are retained when deselected
+    tabs.active = 0
+    assert tab2.child is div2
+    assert model.ref['id'] in tabs[1]._models
+
+
+def test_column_reorder_reuses_child_models(document, comm):
+    divs = [Div() for _ in range(5)]
+    col = Column(*divs)
+    model = col.get_root(document, comm=comm)
+    panes = list(col.objects)
+
+    col[:] = panes[::-1][:4]
+    assert model.children == divs[::-1][:4]
+    assert panes[0]._models == {}
+    assert all(model.ref['id'] in p._models for p in panes[1:])
+
+
+def test_column_append_applies_delta(document, comm):
+    div1, div2 = Div(), Div()
+    col = Column(div1)
+    model = col.get_root(document, comm=comm)
+    children = model.children
+
+    col.append(div2)
+    assert model.children is children
+    assert model.children == [div1, div2]
+    assert col._delta[2:4] == ('insert', 1)
+
+
+def test_column_insert_pop_and_setitem_apply_delta(document, comm):
+    div1, div2, div3, div4 = Div(), Div(), Div(), Div()
+    col = Column(div1, div2)
+    model = col.get_root(document, comm=comm)
+    p1 = col[0]
+
+    col.insert(-1, div3)
+    assert model.children == [div1, div3, div2]
+
+    col.pop(0)
+    assert model.children == [div3, div2]
+    assert p1._models == {}
+
+    col[-1] = div4
+    assert model.children == [div3, div4]
+
+
+def test_column_delta_falls_back_when_merged(document):
+    div1, div2, div3 = Div(), Div(), Div()
+    col = Column(div1)
+    model = col.get_root(document)
+
+    col.append(div2)
+    col.append(div3)
+    document.session_callbacks[0].callback()
+    assert model.children == [div1, div2, div3]
+
+
 def test_spacer(document, comm):
     spacer = Spacer(width=400, height=300)
 
@@ -938,6 +1080,69 @@ def test_gridspec_setitem_span_override():
     assert gspec.objects[(0, 0, 1, 1)].object is div2
 
 
+def test_gridspec_setitem_span_override_removes_span():
+    gspec = GridSpec(mode='override')
+    gspec[0, :] = Div()
+    gspec[0, 0] = Div()
+    assert list(gspec.objects) == [(0, 0, 1, 1)]
+
+
+def test_gridspec_index_updated_incrementally():
+    gspec = GridSpec(mode='override')
+    for i in range(3):
+        for j in range(3):
+            gspec[i, j] = Div()
+    index = gspec._get_index()
+
+    div = Div()
+    gspec[1, 1] = div
+    del gspec[0, 0]
+    assert gspec._get_index() is index
+    assert gspec[1, 1].object is div
+    assert (gspec.grid == [[0, 1, 1], [1, 1, 1], [1, 1, 1]]).all()
+
+
+def test_gridspec_index_rebuilt_on_objects_change():
+    gspec = GridSpec()
+    gspec[0, 0] = Div()
+    assert gspec.nrows == 1 and gspec.ncols == 1
+
+    gspec.objects = OrderedDict([((0, 0, 2, 3), Bokeh(Div()))])
+    assert gspec.nrows == 2 and gspec.ncols == 3
+    assert gspec.grid.sum() == 6
+
+
+def test_gridspec_index_rebuilt_on_objects_mutated_in_place():
+    gspec = GridSpec()
+    gspec[0, 0] = Div()
+    assert gspec.ncols == 1
+
+    gspec.objects[(0, 1, 1, 3)] = Bokeh(Div())
+    assert gspec.ncols == 3
+    del gspec.objects[(0, 0, 1, 1)]
+    assert (gspec.grid == [[0, 1, 1]]).all()
+
+
+def test_gridspec_index_reuses_codes_of_removed_keys():
+    gspec = GridSpec(mode='override')
+    for i in range(3):
+        for j in range(3):
+            gspec[i, j] = Div()
+    index = gspec._get_index()
+    for _ in range(5):
+        del gspec[1, 1]
+        gspec[1, 1] = Div()
+    assert gspec._get_index() is index
+    assert sorted(index._lookup) == list(range(9))
+
+
+def test_gridspec_getitem_empty_cell():
+    gspec = GridSpec()
+    gspec[0, 1] = Div()
+    with pytest.raises(IndexError):
+        gspec[0, 0]
+
+
 def test_gridspec_fixed_with_int_setitem(document, comm):
     div1 = Div()
     div2 = Div()
@@ -1050,6 +1255,46 @@ def test_gridspec_stretch_with_slice_setitem(document, comm):
     assert div2.style == {'width': '100%', 'height': '100%'}
 
 
+def test_gridspec_setitem_reuses_unchanged_models(document, comm):
+    gspec = GridSpec(width=400, height=400, mode='override')
+    for i in range(4):
+        gspec[i//2, i%2] = '# %d' % i
+    model = gspec.get_root(document, comm=comm)
+    children = [child for child, _, _, _, _ in model.children]
+    pane = gspec[1, 1]
+
+    gspec[1, 1] = '# New'
+    new_children = [child for child, _, _, _, _ in model.children]
+    assert new_children[:3] == children[:3]
+    assert new_children[3] is not children[3]
+    assert pane._models == {}
+
+
+def test_gridspec_resize_updates_changed_models(document, comm):
+    div1, div2 = Div(), Div()
+    gspec = GridSpec(width=400, height=400)
+    gspec[0, 0] = div1
+    gspec[1, 0] = div2
+    model = gspec.get_root(document, comm=comm)
+    assert div1.width == 400
+
+    div3 = Div()
+    gspec[0, 1] = div3
+    assert model.children == [(div1, 0, 0, 1, 1), (div2, 1, 0, 1, 1), (div3, 0, 1, 1, 1)]
+    assert div1.width == div2.width == div3.width == 200
+
+
+def test_gridspec_cleanup(document, comm):
+    gspec = GridSpec()
+    gspec[0, 0] = Div()
+    model = gspec.get_root(document, comm=comm)
+    pane = gspec[0, 0]
+
+    gspec._cleanup(model)
+    assert gspec._models == {}
+    assert pane._models == {}
+
+
 def test_widgetbox(document, comm):
     widget_box = WidgetBox("WidgetBox")
 
@@ -1061,3 +1306,40 @@ def test_widgetbox(document, comm):
     assert not widget_box.horizontal
     widget_box.horizontal = True
     assert widget_box.horizontal
+
+
+def test_virtual_column_renders_window(document, comm):
+    divs = [Div() for _ in range(100)]
+    col = VirtualColumn(*divs, height=100, item_height=20, overscan=2)
+    model = col.get_root(document, comm=comm)
+
+    before, after = model.children[0], model.children[-1]
+    assert model.children[1:-1] == divs[:7]
+    assert before.height == 0
+    assert after.height == 93*20
+    assert all(model.ref['id'] not in p._models for p in col[7:])
+
+
+def test_virtual_column_scroll(document):
+    divs = [Div() for _ in range(100)]
+    col = VirtualColumn(*divs, height=100, item_height=20, overscan=2)
+    model = col.get_root(document)
+    p0 = col[0]
+
+    model.scroll_index = 1
+    assert model.children[1:-1] == divs[:7]
+
+    model.scroll_index = 50
+    assert model.children[1:-1] == divs[48:57]
+    assert model.children[0].height == 48*20
+    assert model.children[-1].height == 43*20
+    assert p0._models == {}
+
+
+def test_virtual_column_append(document, comm):
+    col = VirtualColumn(Div(), height=100, item_height=20)
+    model = col.get_root(document, comm=comm)
+    div = Div()
+    col.append(div)
+    assert model.children[1:-1][-1] is div
+    assert model.children[-1].height == 0
@@ -4,7 +4,7 @@ import holoviews as hv
 
 from bokeh.plotting import figure
 from panel.layout import Row
-from panel.links import GenericLink
+from panel.links import GenericLink, Link
 from panel.pane import HoloViews
 from panel.widgets import FloatSlider, RangeSlider, ColorPicker
 from panel._testing.util import hv_available
@@ -138,3 +138,37 @@ def test_link_with_customcode(document, comm):
     assert link_customjs.args['source'] is range_slider
     assert link_customjs.args['x_range'] is x_range
     assert link_customjs.code == code
+
+
+def test_link_added_on_append(document, comm):
+    widget = ColorPicker(value='#ff00ff')
+    bokeh_fig = figure()
+    scatter = bokeh_fig.scatter([1, 2, 3], [1, 2, 3])
+
+    widget.jslink(scatter.glyph, value='fill_color')
+
+    row = Row(bokeh_fig)
+    model = row.get_root(document, comm=comm)
+    row.append(widget)
+
+    link_customjs = model.children[1].js_property_callbacks['change:color'][-1]
+    assert link_customjs.args['source'] is model.children[1]
+    assert link_customjs.args['target'] is scatter.glyph
+
+
+def test_unlinked_append_skips_link_processing(document, comm):
+    widget = ColorPicker(value='#ff00ff')
+    bokeh_fig = figure()
+    scatter = bokeh_fig.scatter([1, 2, 3], [1, 2, 3])
+
+    widget.jslink(scatter.glyph, value='fill_color')
+
+    row = Row(bokeh_fig, widget, FloatSlider())
+    model = row.get_root(document, comm=comm)
+    assert Link._has_links(model, [row[0]])
+    assert Link._has_links(model, [row[1]])
+    assert not Link._has_links(model, [row[2]])
+
+    callbacks = list(model.children[1].js_property_callbacks['change:color'])
+    row.append(FloatSlider())
+    assert model.children[1].js_property_callbacks['change:color'] == callbacks
@@ -1,6 +1,7 @@
 from functools import partial
 
 import param
+import pytest
 
 from bokeh.models import Div
 from panel.viewable import Reactive
@@ -76,3 +77,266 @@ def test_link_properties_server(document):
     assert isinstance(cb, partial)
     assert cb.args == (document,)
     assert cb.func == obj._server_change
+
+
+def test_server_updates_batched_per_tick(document):
+    from panel.widgets import TextInput
+
+    widgets = [TextInput() for _ in range(3)]
+    models = [w.get_root(document) for w in widgets]
+    for model in models:
+        document.add_root(model)
+
+    for i, w in enumerate(widgets):
+        w.value = 'A'
+        w.value = 'B%d' % i
+
+    # All updates share a single next tick callback on the document
+    assert len(document.session_callbacks) == 1
+    assert all(m.value == '' for m in models)
+
+    events = []
+    document.on_change(lambda event: events.append(event))
+    document.session_callbacks[0].callback()
+
+    assert [m.value for m in models] == ['B0', 'B1', 'B2']
+    assert len([e for e in events if getattr(e, 'attr', None) == 'value']) == 3
+
+
+def test_server_updates_merge_events(document):
+    from panel.layout import Row
+    from panel.pane import Str
+
+    row = Row()
+    model = row.get_root(document)
+    row.append(Str('A'))
+    row.append(Str('B'))
+
+    document.session_callbacks[0].callback()
+    assert [c.text for c in model.children] == ['<pre>A</pre>', '<pre>B</pre>']
+
+
+def test_hold_comm_batches_push(document):
+    from panel.io.model import add_to_doc
+    from panel.layout import Row
+    from panel.widgets import TextInput
+
+    class RecordingComm(object):
+        id = 'test'
+        def __init__(self):
+            self.messages = []
+        def send(self, data=None, buffers=[]):
+            self.messages.append(data)
+
+    comm = RecordingComm()
+    w1, w2 = TextInput(), TextInput()
+    row = Row(w1, w2)
+    model = row.get_root(document, comm)
+    add_to_doc(model, document, hold=True)
+
+    with row.batch():
+        w1.value = 'A'
+        w2.value = 'B'
+        assert [c.value for c in model.children] == ['', '']
+        assert comm.messages == []
+
+    assert [c.value for c in model.children] == ['A', 'B']
+    # A single PATCH-DOC message consists of header, metadata and content
+    assert len(comm.messages) == 3
+
+
+def test_hold_server_defers_to_next_tick(document):
+    from panel.io import state
+    from panel.widgets import TextInput
+
+    w1, w2 = TextInput(), TextInput()
+    m1, m2 = w1.get_root(document), w2.get_root(document)
+
+    with state.hold(w1, w2):
+        w1.value = 'A'
+        w2.value = 'B'
+        assert document.session_callbacks == []
+
+    assert len(document.session_callbacks) == 1
+    document.session_callbacks[0].callback()
+    assert (m1.value, m2.value) == ('A', 'B')
+
+
+def test_update_policy_throttle_server(document):
+    from bokeh.server.callbacks import NextTickCallback, TimeoutCallback
+    from panel.widgets import FloatSlider
+
+    slider = FloatSlider(update_policy='throttle', throttle=100)
+    slider.get_root(document)
+
+    slider._server_change(document, 'value', 0, 1)
+    cb = document.session_callbacks[0]
+    assert isinstance(cb, NextTickCallback)
+    cb.callback()
+    assert slider.value == 1
+
+    slider._server_change(document, 'value', 1, 2)
+    cb = document.session_callbacks[-1]
+    assert isinstance(cb, TimeoutCallback)
+    assert 0 < cb.timeout <= 100
+    assert slider.value == 1
+
+
+def test_update_policy_per_parameter():
+    from panel.widgets import TextInput
+
+    text = TextInput(update_policy={'value': 'throttle'}, throttle=200)
+    assert text._get_update_policy('value') == ('throttle', 200)
+    assert text._get_update_policy('title') == ('debounce', 50)
+
+
+def test_update_policy_invalid():
+    from panel.widgets import TextInput
+
+    with pytest.raises(ValueError):
+        TextInput(update_policy='foo')
+
+
+def test_update_policy_parameters_cloned_and_not_synced(document, comm):
+    from panel.widgets import TextInput
+
+    text = TextInput(update_policy='throttle', throttle=200)
+    clone = text.clone()
+    assert (clone.update_policy, clone.throttle) == ('throttle', 200)
+
+    model = text.get_root(document, comm=comm)
+    text.debounce = 100
+    assert text._get_update_policy('title') == ('throttle', 200)
+    assert 'debounce' not in model.properties()
+
+
+def test_update_policy_parameters_not_passed_to_models(document, comm):
+    from panel.param import Param
+    from panel.widgets import StaticText
+
+    class Test(param.Parameterized):
+        number = param.Number(default=1)
+
+        text = param.String(default='A')
+
+    text = StaticText(value='A', debounce=100)
+    model = text.get_root(document, comm=comm)
+    assert model.text == 'A'
+
+    layout = Param(Test()).get_root(document, comm=comm)
+    assert len(layout.children) == 3
+
+
+def test_update_policy_release_links_throttled_value(document):
+    from panel.widgets import FloatSlider
+
+    slider = FloatSlider(update_policy='release')
+    model = slider.get_root(document)
+    if 'value_throttled' not in model.properties():
+        pytest.skip('bokeh version does not support value_throttled')
+    assert 'value_throttled' in model._callbacks
+    assert 'value' not in model._callbacks
+
+    slider._server_change(document, 'value_throttled', 0, 0.5)
+    document.session_callbacks[-1].callback()
+    assert slider.value == 0.5
+
+
+def test_server_update_unchanged_values_dropped(document):
+    from panel.widgets import Select
+
+    select = Select(options=['A', 'B', 'C'])
+    model = select.get_root(document)
+    document.add_root(model)
+
+    events = []
+    document.on_change(lambda event: events.append(getattr(event, 'attr', None)))
+    select._update_model({}, {'options': ['A', 'B', 'C']}, model, model, document)
+    assert 'options' not in events
+
+    select._update_model({}, {'options': ['A', 'B']}, model, model, document)
+    assert events.count('options') == 1
+
+
+def test_change_event_on_thread_pool(document):
+    import threading
+    from panel.config import config
+    from panel.io.state import state
+    from panel.widgets import IntSlider
+
+    slider = IntSlider(start=0, end=10)
+    model = slider.get_root(document)
+    document.add_root(model)
+
+    values = []
+    slider.param.watch(lambda e: values.append(e.new), 'value')
+    with config.set(nthreads=2):
+        # Block the queue of the Document while events arrive
+        release, done = threading.Event(), threading.Event()
+        state._submit(document, lambda: release.wait(5))
+        for i in range(1, 6):
+            slider._events = {'value': i}
+            slider._change_event(document)
+        release.set()
+        state._submit(document, done.set)
+        assert done.wait(5)
+
+    # Superseded events are dropped and model updates deferred
+    assert values == [5]
+    assert model.value == 0
+    document.session_callbacks[-1].callback()
+    assert model.value == 5
+
+
+def test_thread_pool_update_superseded_by_frontend_dropped(document):
+    from panel.widgets import IntSlider
+
+    slider = IntSlider(start=0, end=10)
+    model = slider.get_root(document)
+    document.add_root(model)
+
+    slider._queue_update({}, {'value': 3}, model, model, document)
+    slider._thread_events[document] = {'value': 7}
+    document.session_callbacks[-1].callback()
+    assert model.value == 0
+
+
+def test_params_only_watched_while_rendered(document, comm):
+    from panel.widgets import TextInput
+
+    text = TextInput()
+    assert text._param_watcher is None
+    assert 'value' not in text._param_watchers
+
+    model = text.get_root(document, comm)
+    assert text._param_watchers['value']['value'] == [text._param_watcher]
+
+    text._cleanup(model)
+    assert text._param_watcher is None
+    assert text._param_watchers['value']['value'] == []
+
+    model = text.get_root(document, comm)
+    text.value = 'A'
+    assert model.value == 'A'
+
+
+def test_param_watcher_precedes_user_watchers(document, comm):
+    from panel.widgets import TextInput
+
+    text = TextInput()
+    user_watcher = text.param.watch(lambda e: None, 'value')
+    text.get_root(document, comm)
+    assert text._param_watchers['value']['value'] == [text._param_watcher, user_watcher]
+
+
+def test_property_mapping_compiled_per_class():
+    from panel.widgets import TextInput
+
+    text = TextInput()
+    forward, inverted, dropped = text._get_property_mapping()
+    assert forward == {'name': 'title'}
+    assert inverted == {'title': 'name'}
+    assert Reactive._property_mappings[TextInput][1] is forward
+    assert TextInput()._get_property_mapping()[0] is forward
+    assert text._process_property_change({'title': 'A', 'value': 'B'}) == {
+        'name': 'A', 'value': 'B'}
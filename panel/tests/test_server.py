@@ -48,3 +48,129 @@ def test_server_change_io_state():
     html._server_change(session.document, 'text', '<h1>Title</h1>', '<h1>New Title</h1>')
 
     server.stop()
+
+
+def test_server_doc_clones_prototype(document):
+    from bokeh.document import Document
+    from panel.config import config
+    from panel.layout import Column
+    from panel.pane import Markdown
+    from panel.widgets import TextInput
+
+    md = Markdown('# Title')
+    text = TextInput(value='A')
+    col = Column(md, text)
+
+    with config.set(prototypes=True):
+        col.server_doc(document)
+        rendered = md._get_model
+        md._get_model = None
+        try:
+            doc = Document()
+            col.server_doc(doc)
+        finally:
+            md._get_model = rendered
+
+    root1, root2 = document.roots[0], doc.roots[0]
+    assert root1.id != root2.id
+    assert root2.children[0].text == root1.children[0].text
+    assert root2.children[0] is not root1.children[0]
+    assert text._models[root2.ref['id']][0] is root2.children[1]
+    assert md._models[root2.ref['id']][0] is root2.children[0]
+    cb = root2.children[1]._callbacks['value'][0]
+    assert cb.args == (doc,)
+
+
+def test_server_doc_image_not_cloned_from_prototype(document, tmpdir):
+    from base64 import b64decode
+    from bokeh.document import Document
+    from panel.config import config
+    from panel.layout import Column
+    from panel.pane import PNG
+
+    path = tmpdir.join('image.png')
+    path.write_binary(b64decode(
+        b'iVBORw0KGgoAAAANSUhEUgAAAAIAAAABCAYAAAD0In+KAAAAFElEQVQIHQEJAPb'
+        b'/AWNYYP/h4uMAFL0EwlEn99gAAAAASUVORK5CYII='))
+    col = Column(PNG(str(path)))
+
+    with config.set(prototypes=True):
+        col.server_doc(document)
+        assert col._clone_prototype(Document()) is None
+
+
+def test_server_prototype_update():
+    from panel.config import config
+
+    html = HTML('<h1>Title</h1>')
+
+    with config.set(prototypes=True):
+        server = html._get_server(port=5006)
+        url = "http://localhost:" + str(server.port) + "/"
+        session1 = pull_session(session_id='Test1', url=url, io_loop=server.io_loop)
+        html.object = '<h1>New Title</h1>'
+        session2 = pull_session(session_id='Test2', url=url, io_loop=server.io_loop)
+
+    session1.pull()
+    for session in (session1, session2):
+        root = session.document.roots[0]
+        assert isinstance(root, BkHTML)
+        assert root.text == '&lt;h1&gt;New Title&lt;/h1&gt;'
+    server.stop()
+
+
+def test_session_pool_transfers_view():
+    from bokeh.document import Document
+    from tornado.ioloop import IOLoop
+    from panel.io.server import _SessionPool
+
+    html = HTML('<h1>Title</h1>')
+    loop = IOLoop.current()
+    pool = _SessionPool(html, 1, loop)
+    pool.schedule()
+    loop.run_sync(lambda: None)
+    assert len(pool) == 1
+    root, source = pool._views[0]
+
+    doc = Document()
+    html._modify_doc(None, doc, pool=pool)
+    assert doc.roots == [root]
+    assert state._views[root.ref['id']][2] is doc
+    assert html._documents[doc] is root
+    loop.run_sync(lambda: None)
+    assert len(pool) == 1
+
+
+def test_server_warm_sessions():
+    html = HTML('<h1>Title</h1>')
+
+    server = html._get_server(port=5006, warm_sessions=1)
+    html.object = '<h1>New Title</h1>'
+
+    url = "http://localhost:" + str(server.port) + "/"
+    session = pull_session(session_id='Test', url=url, io_loop=server.io_loop)
+    root = session.document.roots[0]
+    assert root.text == '&lt;h1&gt;New Title&lt;/h1&gt;'
+
+    html.object = '<h1>Final Title</h1>'
+    session.pull()
+    root = session.document.roots[0]
+    assert root.text == '&lt;h1&gt;Final Title&lt;/h1&gt;'
+    server.stop()
+
+
+def test_server_serves_image_from_content_store(tmpdir):
+    from base64 import b64decode
+    from panel.pane import PNG
+    path = tmpdir.join('image.png')
+    path.write_binary(b64decode(
+        b'iVBORw0KGgoAAAANSUhEUgAAAAIAAAABCAYAAAD0In+KAAAAFElEQVQIHQEJAPb'
+        b'/AWNYYP/h4uMAFL0EwlEn99gAAAAASUVORK5CYII='))
+    png = PNG(str(path))
+
+    server = png._get_server(port=5006)
+    url = "http://localhost:" + str(server.port) + "/"
+    session = pull_session(session_id='Test', url=url, io_loop=server.io_loop)
+    root = session.document.roots[0]
+    assert "src='/panel/content/" in root.text
+    server.stop()
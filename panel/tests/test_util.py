@@ -1,10 +1,12 @@
 from collections import OrderedDict
 
+import numpy as np
+
 from bokeh.models import Div
 
 from panel.io.notebook import render_mimebundle
 from panel.pane import PaneBase
-from panel.util import get_method_owner, abbreviated_repr
+from panel.util import get_method_owner, abbreviated_repr, values_equal
 
 
 def test_get_method_owner_class():
@@ -37,3 +39,28 @@ def test_abbreviated_repr_list():
 def test_abbreviated_repr_ordereddict():
     assert (abbreviated_repr(OrderedDict([('key', 'some really, really long string')]))
             == "OrderedDict([('key', ...])")
+
+
+def test_values_equal_lists():
+    assert values_equal(['A', 'B'], ['A', 'B'])
+    assert not values_equal(['A', 'B'], ['A', 'C'])
+    assert not values_equal(['A', 'B'], ['A'])
+    assert not values_equal(['A', 'B'], ('A', 'B'))
+
+
+def test_values_equal_bool():
+    assert not values_equal(1, True)
+    assert values_equal(True, True)
+
+
+def test_values_equal_arrays():
+    assert values_equal(np.arange(3), np.arange(3))
+    assert not values_equal(np.arange(3), np.arange(3.))
+    assert not values_equal(np.arange(3), np.arange(4))
+    assert not values_equal(np.arange(3), [0, 1, 2])
+
+
+def test_values_equal_dict_of_arrays():
+    assert values_equal({'x': np.arange(3)}, {'x': np.arange(3)})
+    assert not values_equal({'x': np.arange(3)}, {'x': np.ones(3)})
+    assert not values_equal({'x': np.arange(3)}, {'y': np.arange(3)})
@@ -85,3 +85,25 @@ def test_widget_triggers_events(document, comm):
     assert event.attr == 'value'
     assert event.model is widget
     assert event.new == '123'
+
+
+def test_widget_linked_properties_cached(document, comm):
+    text = TextInput(value='A')
+    text.get_root(document, comm)
+    rename, properties = Widget._linked_properties[TextInput]
+    assert rename is TextInput._rename
+    assert 'value' in properties and 'title' in properties
+    assert TextInput()._get_linked_properties() == properties
+
+
+def test_widget_value_dependent_linked_properties_not_cached():
+    class OptionalTitle(TextInput):
+        def _process_param_change(self, msg):
+            msg = super(OptionalTitle, self)._process_param_change(msg)
+            if not msg.get('title'):
+                msg.pop('title', None)
+            return msg
+
+    assert 'title' not in OptionalTitle()._get_linked_properties()
+    assert 'title' in OptionalTitle(name='A')._get_linked_properties()
+    assert OptionalTitle not in Widget._linked_properties
@@ -32,3 +32,41 @@ def test_toggle(document, comm):
 
     toggle.value = True
     assert widget.active == True
+
+
+def test_button_on_click_coroutine():
+    from tornado import gen
+
+    button = Button()
+    clicks = []
+
+    @gen.coroutine
+    def callback(event):
+        yield gen.moment
+        clicks.append(event.new)
+
+    button.on_click(callback)
+    button.clicks += 1
+    assert clicks == [1]
+
+
+def test_button_on_click_coroutine_scheduled_on_loop():
+    from tornado import gen
+    from tornado.ioloop import IOLoop
+
+    button = Button()
+    clicks = []
+
+    @gen.coroutine
+    def callback(event):
+        clicks.append(event.new)
+
+    @gen.coroutine
+    def click():
+        button.clicks += 1
+        assert clicks == []
+        yield gen.sleep(0.01)
+        assert clicks == [1]
+
+    button.on_click(callback)
+    IOLoop.current().run_sync(click)
@@ -60,6 +60,47 @@ def indexOf(obj, objs):
     raise ValueError('%s not in list' % obj)
 
 
+def values_equal(a, b):
+    """
+    Checks whether two values are equal, using cheap checks on the
+    identity, type, length, shape and dtype of the values before
+    falling back to a full comparison. Any value which cannot be
+    compared is considered to be unequal.
+    """
+    if a is b:
+        return True
+    elif isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    elif 'numpy' in sys.modules:
+        import numpy as np
+        if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+            if not (isinstance(a, np.ndarray) and isinstance(b, np.ndarray)):
+                return False
+            elif a.shape != b.shape or a.dtype != b.dtype:
+                return False
+            try:
+                return bool(np.array_equal(a, b))
+            except Exception:
+                return False
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        if type(a) is not type(b) and tuple in (type(a), type(b)):
+            return False
+        elif len(a) != len(b):
+            return False
+    elif isinstance(a, dict) and isinstance(b, dict):
+        if len(a) != len(b) or set(a) != set(b):
+            return False
+    try:
+        return bool(a == b)
+    except Exception:
+        pass
+    if isinstance(a, (list, tuple)):
+        return all(values_equal(x, y) for x, y in zip(a, b))
+    elif isinstance(a, dict):
+        return all(values_equal(a[k], b[k]) for k in a)
+    return False
+
+
 def as_unicode(obj):
     """
     Safely casts any object to unicode including regular string
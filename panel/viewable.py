@@ -5,30 +5,39 @@ response to changes to parameters and the underlying bokeh models.
 """
 from __future__ import absolute_import, division, unicode_literals
 
+import json
 import re
 import sys
 import threading
+import time
+import weakref
 
 from functools import partial
 
 import param
 
+from bokeh.core.json_encoder import serialize_json
 from bokeh.document.document import Document as _Document, _combine_document_events
 from bokeh.document.events import ModelChangedEvent
+from bokeh.document.util import (
+    initialize_references_json, instantiate_references_json, references_json
+)
 from bokeh.io import curdoc as _curdoc
 from bokeh.models import CustomJS
+from bokeh.util.serialization import make_id
 from pyviz_comms import JupyterCommManager
 
 from .callbacks import PeriodicCallback
 from .config import config, panel_extension
 from .io.embed import embed_state
-from .io.model import add_to_doc
-from .io.notebook import (get_comm_customjs, push, render_mimebundle,
+from .io.model import add_to_doc, hold
+from .io.notebook import (get_comm_customjs, render_mimebundle,
                           render_model, show_embed, show_server)
 from .io.save import save
 from .io.state import state
+from .io.stats import timed, timed_call
 from .io.server import StoppableThread, get_server
-from .util import param_reprs
+from .util import param_reprs, values_equal
 
 
 class Layoutable(param.Parameterized):
@@ -200,13 +209,23 @@ class Viewable(Layoutable):
 
     __abstract = True
 
+    # Hooks applied to the whole tree whenever a view is preprocessed,
+    # called with the root Viewable and the root model
     _preprocessing_hooks = []
 
+    # Hooks which may restrict themselves to the changed subtrees of
+    # a view, additionally called with the list of changed Viewables
+    # (or None if the whole tree has to be processed)
+    _incremental_hooks = []
+
     def __init__(self, **params):
         super(Viewable, self).__init__(**params)
         self._documents = {}
         self._models = {}
         self._found_links = set()
+        self._selection_index = None
+        self._children_version = 0
+        self._prototype = None
 
     def __repr__(self, depth=0):
         return '{cls}({params})'.format(cls=type(self).__name__,
@@ -247,12 +266,24 @@ class Viewable(Layoutable):
           Bokeh model for the view being cleaned up
         """
 
-    def _preprocess(self, root):
+    @timed
+    def _preprocess(self, root, changed=None):
         """
         Applies preprocessing hooks to the model.
+
+        Arguments
+        ---------
+        root: bokeh.model.Model
+          The root model of the view being preprocessed
+        changed: list(Viewable) or None
+          The Viewables whose models were (re-)rendered since the view
+          was last preprocessed. Incremental hooks only have to handle
+          these subtrees, if None the whole tree is processed.
         """
         for hook in self._preprocessing_hooks:
             hook(self, root)
+        for hook in self._incremental_hooks:
+            hook(self, root, changed)
 
     def _render_model(self, doc=None, comm=None):
         if doc is None:
@@ -300,16 +331,128 @@ class Viewable(Layoutable):
         Server lifecycle hook triggered when session is destroyed.
         """
         doc = session_context._document
-        self._cleanup(self._documents[doc])
-        del self._documents[doc]
+        root = self._documents.pop(doc, None)
+        if root is not None and root.ref['id'] in self._models:
+            self._cleanup(root)
+
+    def _get_prototype(self):
+        """
+        Returns the prototype view of the Viewable, consisting of the
+        root model rendered on a private Document, the Reactive objects
+        which rendered models on it and the cached JSON representation
+        of its models (None if the models changed since it was cached).
+        The prototype is kept in sync like any other view.
+        """
+        if self._prototype is None:
+            doc = _Document()
+            recorded = _ModelIndex._recording = []
+            try:
+                root = self.get_root(doc)
+            finally:
+                _ModelIndex._recording = None
+            ref = root.ref['id']
+            owners = _ModelIndex._prototypes[ref] = weakref.WeakSet()
+            for key, obj in recorded:
+                if key == ref:
+                    owners.add(obj)
+            doc.add_root(root)
+            doc.on_change(self._invalidate_prototype)
+            self._prototype = [root, doc, owners, None]
+        return self._prototype
+
+    def _invalidate_prototype(self, event):
+        if isinstance(event, ModelChangedEvent) and self._prototype:
+            self._prototype[3] = None
+
+    def _clone_prototype(self, doc):
+        """
+        Renders the Viewable on the supplied Document by cloning the
+        models of the prototype view with fresh ids, registering the
+        cloned models on each of the Reactive objects and rebinding the
+        python callbacks of the prototype models to the cloned models.
+        Returns None if the view cannot be cloned.
+        """
+        root, proto_doc, owners, refs_json = self._get_prototype()
+        ref = root.ref['id']
+        owners = [o for o in owners if ref in o._models]
+        if not all(o._prototype_safe for o in owners):
+            return None
+
+        # Apply any model updates queued on the prototype
+        if _flush_detached(proto_doc):
+            refs_json = None
+
+        models = root.references()
+        if refs_json is None:
+            refs_json = serialize_json(references_json(models))
+            self._prototype[3] = refs_json
+        ids = {m.id: make_id() for m in models}
+        refs = _remap_ids(json.loads(refs_json), ids)
+        references = instantiate_references_json(refs)
+        initialize_references_json(refs, references)
+
+        mapping = {id(m): references[ids[m.id]] for m in models}
+        mapping[id(proto_doc)] = doc
+        clone = mapping[id(root)]
+        clone_ref = clone.ref['id']
+        for obj in owners:
+            model, parent = obj._models[ref]
+            obj._models[clone_ref] = (mapping[id(model)], mapping.get(id(parent)))
+        for model in models:
+            new = mapping[id(model)]
+            for attr, callbacks in model._callbacks.items():
+                for cb in callbacks:
+                    new.on_change(attr, _rebind(cb, mapping))
+            for event, callbacks in model._event_callbacks.items():
+                new.on_event(event, *(_rebind(cb, mapping) for cb in callbacks))
+        self._preprocess(clone)
+        state._register_view(self, clone, doc)
+        return clone
+
+    def _render_server_view(self, doc):
+        """
+        Renders the root model of a server view on the supplied
+        Document, cloning it from the prototype view if enabled.
+        """
+        model = self._clone_prototype(doc) if config.prototypes else None
+        if model is None:
+            model = self.get_root(doc)
+        return model
+
+    def _transfer_view(self, root, source, doc):
+        """
+        Transfers a view rendered ahead of time on the source Document
+        to the supplied Document, rebinding the callbacks of its models.
+        """
+        _flush_detached(source)
+        mapping = {id(source): doc}
+        for model in root.references():
+            for attr, callbacks in model._callbacks.items():
+                model._callbacks[attr] = [_rebind(cb, mapping) for cb in callbacks]
+            for event, callbacks in model._event_callbacks.items():
+                model._event_callbacks[event] = [_rebind(cb, mapping) for cb in callbacks]
+        state._register_view(self, root, doc)
+
+    def _add_server_root(self, doc, model):
+        if hasattr(doc, 'on_session_destroyed'):
+            doc.on_session_destroyed(self._server_destroy)
+            self._documents[doc] = model
+        add_to_doc(model, doc)
+        return doc
 
-    def _modify_doc(self, server_id, doc):
+    def _modify_doc(self, server_id, doc, pool=None):
         """
-        Callback to handle FunctionHandler document creation.
+        Callback to handle FunctionHandler document creation, using
+        a view from the pool of warm sessions if one is available.
         """
         if server_id:
             state._servers[server_id][2].append(doc)
-        return self.server_doc(doc)
+        view = None if pool is None else pool.pop()
+        if view is None:
+            return self.server_doc(doc)
+        root, source = view
+        self._transfer_view(root, source, doc)
+        return self._add_server_root(doc, root)
 
     def _get_server(self, port=0, websocket_origin=None, loop=None,
                    show=False, start=False, **kwargs):
@@ -320,6 +463,18 @@ class Viewable(Layoutable):
     # Public API
     #----------------------------------------------------------------
 
+    def batch(self):
+        """
+        Returns a context manager which holds all Documents this
+        object is rendered in, releasing all changes made inside the
+        block as a single batch of events on exit.
+
+        Returns
+        -------
+        A context manager
+        """
+        return state.hold(self)
+
     def clone(self, **params):
         """
         Makes a copy of the object sharing the same parameters.
@@ -340,6 +495,43 @@ class Viewable(Layoutable):
         """
         print(self)
 
+    def _traverse(self):
+        """
+        Lazily iterates over the Viewable and all its children in
+        depth-first order.
+        """
+        yield self
+
+    def _selection_version(self):
+        """
+        Returns the version of the children of the Viewable, which
+        changes whenever its children change, or None if the Viewable
+        has no children.
+        """
+        return None
+
+    def _invalidate_selections(self, *events):
+        self._children_version += 1
+
+    def _cached_select(self, selector):
+        """
+        Selects the Viewable and any children matching the type
+        selector, caching the selection until the children of the
+        Viewable or of any Viewable in its tree change. Used by the
+        preprocessing hooks, which query the same tree on every update.
+        """
+        index = self._selection_index
+        if index is None or any(v._selection_version() != version
+                                for v, version in index[0]):
+            versions = [(v, v._selection_version()) for v in self._traverse()]
+            versions = [(v, version) for v, version in versions
+                        if version is not None]
+            index = self._selection_index = (versions, {})
+        selections = index[1]
+        if selector not in selections:
+            selections[selector] = self.select(selector)
+        return list(selections[selector])
+
     def select(self, selector=None):
         """
         Iterates over the Viewable and any potential children in the
@@ -355,12 +547,13 @@ class Viewable(Layoutable):
         -------
         viewables: list(Viewable)
         """
-        if (selector is None or
-            (isinstance(selector, type) and isinstance(self, selector)) or
-            (callable(selector) and not isinstance(selector, type) and selector(self))):
-            return [self]
-        else:
-            return []
+        if selector is None:
+            return list(self._traverse())
+        elif isinstance(selector, type):
+            return [obj for obj in self._traverse() if isinstance(obj, selector)]
+        elif callable(selector):
+            return [obj for obj in self._traverse() if selector(obj)]
+        return []
 
     def app(self, notebook_url="localhost:8888", port=0):
         """
@@ -416,8 +609,7 @@ class Viewable(Layoutable):
         doc = doc or _curdoc()
         root = self._get_model(doc, comm=comm)
         self._preprocess(root)
-        ref = root.ref['id']
-        state._views[ref] = (self, root, doc, comm)
+        state._register_view(self, root, doc, comm)
         return root
 
     def save(self, filename, title=None, resources=None, template=None,
@@ -474,12 +666,8 @@ class Viewable(Layoutable):
         doc = doc or _curdoc()
         if title is not None:
             doc.title = title
-        model = self.get_root(doc)
-        if hasattr(doc, 'on_session_destroyed'):
-            doc.on_session_destroyed(self._server_destroy)
-            self._documents[doc] = model
-        add_to_doc(model, doc)
-        return doc
+        model = self._render_server_view(doc)
+        return self._add_server_root(doc, model)
 
     def servable(self, title=None):
         """
@@ -539,6 +727,116 @@ class Viewable(Layoutable):
 
 
 
+def _remap_ids(obj, ids):
+    """
+    Replaces the model ids in the JSON representation of a set of
+    models (and the references between them) using the supplied
+    mapping from old to new ids.
+    """
+    if isinstance(obj, dict):
+        obj = {k: _remap_ids(v, ids) for k, v in obj.items()}
+        if 'type' in obj and obj.get('id') in ids:
+            obj['id'] = ids[obj['id']]
+        return obj
+    elif isinstance(obj, list):
+        if obj and not isinstance(obj[0], (dict, list)):
+            return obj
+        return [_remap_ids(v, ids) for v in obj]
+    return obj
+
+
+def _flush_detached(doc):
+    """
+    Applies the model updates queued on a Document which is not
+    attached to a session and therefore never processes its next tick
+    callbacks. Returns whether any updates were applied.
+    """
+    if doc not in state._pending_updates:
+        return False
+    state._flush_updates(doc)
+    for callback in list(doc.session_callbacks):
+        doc.remove_next_tick_callback(callback)
+    return True
+
+
+def _rebind(callback, mapping):
+    """
+    Rebinds the arguments of a partial callback bound to the models or
+    Document of a prototype view to the corresponding cloned objects.
+    """
+    if not isinstance(callback, partial):
+        return callback
+    args = [mapping.get(id(arg), arg) for arg in callback.args]
+    return partial(callback.func, *args, **(callback.keywords or {}))
+
+
+class _ModelIndex(dict):
+    """
+    Dictionary of the models rendered for a Reactive component, which
+    notifies the component when its first model is added and when its
+    last model is removed.
+    """
+
+    # Mapping from the ref of a prototype view to the components which
+    # rendered models on it
+    _prototypes = {}
+
+    # List of the (ref, component) pairs of all models added while a
+    # prototype view is rendered
+    _recording = None
+
+    def __init__(self, on_first, on_last, owner=None):
+        super(_ModelIndex, self).__init__()
+        self._on_first = on_first
+        self._on_last = on_last
+        self._owner = owner
+
+    def __setitem__(self, key, value):
+        empty = not self
+        super(_ModelIndex, self).__setitem__(key, value)
+        if self._owner is not None:
+            owners = self._prototypes.get(key)
+            if owners is not None:
+                owners.add(self._owner)
+            elif self._recording is not None:
+                self._recording.append((key, self._owner))
+        if empty:
+            self._on_first()
+
+    def __delitem__(self, key):
+        super(_ModelIndex, self).__delitem__(key)
+        if not self:
+            self._on_last()
+
+    def pop(self, key, *default):
+        empty = not self
+        value = super(_ModelIndex, self).pop(key, *default)
+        if not empty and not self:
+            self._on_last()
+        return value
+
+    def popitem(self):
+        item = super(_ModelIndex, self).popitem()
+        if not self:
+            self._on_last()
+        return item
+
+    def clear(self):
+        empty = not self
+        super(_ModelIndex, self).clear()
+        if not empty:
+            self._on_last()
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+
 class Reactive(Viewable):
     """
     Reactive is a Viewable object that also supports syncing between
@@ -548,30 +846,69 @@ class Reactive(Viewable):
     In order to bi-directionally link parameters with bokeh model
     instances the _link_params and _link_props methods define
     callbacks triggered when either the parameter or bokeh property
-    values change. Since there may not be a 1-to-1 mapping between
+    values change. Parameters are only watched while the object has
+    rendered models. Since there may not be a 1-to-1 mapping between
     parameter and the model property the _process_property_change and
     _process_param_change may be overridden to apply any necessary
     transformations.
     """
 
+    debounce = param.Integer(default=50, bounds=(0, None), precedence=-1, doc="""
+        Delay in milliseconds before property changes from the
+        frontend are processed when using the 'debounce' policy.""")
+
+    throttle = param.Integer(default=50, bounds=(0, None), precedence=-1, doc="""
+        Minimum interval in milliseconds between processed property
+        changes from the frontend when using the 'throttle' policy.""")
+
+    update_policy = param.Parameter(default='debounce', precedence=-1, doc="""
+        Policy used to rate-limit property changes coming from the
+        frontend, either 'debounce', 'throttle' or 'release'. The
+        'release' policy only syncs changes once the user releases
+        the widget, e.g. a slider handle, on components which support
+        it and otherwise behaves like 'debounce'. May also be a
+        dictionary mapping from parameter name to policy.""")
+
     # Timeout if a notebook comm message is swallowed
     _timeout = 20000
 
-    # Timeout before the first event is processed
-    _debounce = 50
+    _update_policies = ['debounce', 'throttle', 'release']
+
+    # Parameters configuring the update policy, which are not synced
+    # with the model unless a subclass explicitly maps them in _rename
+    _policy_params = ('debounce', 'throttle', 'update_policy')
+
+    # Mapping from model properties to properties which only change
+    # once the user releases the widget, used by the 'release' policy
+    _release_properties = {}
 
     # Mapping from parameter name to bokeh model property name
     _rename = {}
 
+    # Cache of the compiled property mappings of each class
+    _property_mappings = {}
+
+    # Whether the models of the component may be cloned from a
+    # prototype view, i.e. the component holds no per-view state
+    # other than its models and their callbacks
+    _prototype_safe = True
+
     def __init__(self, **params):
+        self._validate_update_policy(params.get('update_policy', self.update_policy))
         # temporary flag denotes panes created for temporary, internal
         # use which should be garbage collected once they have been used
         super(Reactive, self).__init__(**params)
+        self.param.watch(lambda event: self._validate_update_policy(event.new),
+                         'update_policy')
         self._processing = False
+        self._last_change = 0
         self._events = {}
+        self._thread_events = weakref.WeakKeyDictionary()
         self._changing = {}
+        self._pending = {}
         self._callbacks = []
-        self._link_params()
+        self._param_watcher = None
+        self._models = _ModelIndex(self._link_params, self._unlink_params, self)
 
     #----------------------------------------------------------------
     # Callback API
@@ -601,13 +938,25 @@ class Reactive(Viewable):
                 event = ModelChangedEvent(doc, model, attr, old, new, serializable_new)
                 _combine_document_events(event, doc._held_events)
         else:
-            model.update(**msg)
+            msg = self._filter_unchanged(model, msg)
+            if msg:
+                model.update(**msg)
+
+    def _filter_unchanged(self, model, msg):
+        """
+        Drops all properties in the msg whose values are equal to the
+        value last synced to the model, ensuring that re-setting a
+        parameter to an equal value does not trigger a (potentially
+        expensive) update of the Document.
+        """
+        return {k: v for k, v in msg.items()
+                if not values_equal(getattr(model, k), v)}
 
     def _link_params(self):
         def param_change(*events):
             msgs = []
             for event in events:
-                msg = self._process_param_change({event.name: event.new})
+                msg = timed_call(self._process_param_change, {event.name: event.new})
                 if msg:
                     msgs.append(msg)
 
@@ -620,20 +969,75 @@ class Reactive(Viewable):
                 if ref not in state._views:
                     continue
                 viewable, root, doc, comm = state._views[ref]
-                if comm or state._unblocked(doc):
-                    self._update_model(events, msg, root, model, doc, comm)
+                if doc in state._held_docs:
+                    self._queue_update(events, msg, root, model, doc, comm)
+                elif comm or state._unblocked(doc):
+                    timed_call(self._update_model, events, msg, root, model, doc, comm)
                     if comm and 'embedded' not in root.tags:
-                        push(doc, comm)
+                        state._schedule_push(doc, comm)
                 else:
-                    cb = partial(self._update_model, events, msg, root, model, doc, comm)
-                    doc.add_next_tick_callback(cb)
+                    self._queue_update(events, msg, root, model, doc, comm)
 
         params = self._synced_params()
-        if params:
+        if params and self._param_watcher is None:
             watcher = self.param.watch(param_change, params)
+            # Ensure models are updated before any other watchers
+            # are triggered, as if the parameters had been watched
+            # since the object was created
+            for p in params:
+                watchers = self._param_watchers[p]['value']
+                watchers.insert(0, watchers.pop(watchers.index(watcher)))
             self._callbacks.append(watcher)
+            self._param_watcher = watcher
+
+    def _unlink_params(self):
+        watcher = self._param_watcher
+        if watcher is None:
+            return
+        self.param.unwatch(watcher)
+        if watcher in self._callbacks:
+            self._callbacks.remove(watcher)
+        self._param_watcher = None
+
+    def _queue_update(self, events, msg, root, model, doc, comm=None):
+        """
+        Queues an update to be applied on the next tick, merging it
+        with any update already pending on the same model so only
+        the latest value of each property is sent.
+        """
+        ref = root.ref['id']
+        with state._lock:
+            if ref in self._pending:
+                pending_events, pending_msg = self._pending[ref]
+                for name, event in events.items():
+                    if name in pending_events:
+                        event = event._replace(old=pending_events[name].old)
+                    pending_events[name] = event
+                pending_msg.update(msg)
+                return
+            self._pending[ref] = (dict(events), dict(msg))
+        cb = partial(self._apply_pending, root, model, doc, comm)
+        state._schedule_update(doc, cb, comm)
+
+    def _apply_pending(self, root, model, doc, comm=None):
+        with state._lock:
+            pending = self._pending.pop(root.ref['id'], None)
+        if pending is None:
+            return
+        events, msg = pending
+        if comm is None:
+            # Do not echo values the frontend has since superseded
+            with state._lock:
+                superseded = set(self._events) | set(self._thread_events.get(doc, {}))
+            msg = {k: v for k, v in msg.items() if k not in superseded}
+            if not msg:
+                return
+        timed_call(self._update_model, events, msg, root, model, doc, comm)
+        if comm and 'embedded' not in root.tags:
+            state._schedule_push(doc, comm)
 
     def _link_props(self, model, properties, doc, root, comm=None):
+        properties = [self._release_property(model, p) for p in properties]
         if comm is None:
             for p in properties:
                 model.on_change(p, partial(self._server_change, doc))
@@ -656,13 +1060,74 @@ class Reactive(Viewable):
         finally:
             self._changing = {}
 
+    def _validate_update_policy(self, policies):
+        if not isinstance(policies, dict):
+            policies = {None: policies}
+        for policy in policies.values():
+            if policy not in self._update_policies:
+                raise ValueError('%s update_policy must be one of %s, not %r.'
+                                 % (type(self).__name__, self._update_policies,
+                                    policy))
+
+    def _get_update_policy(self, attr):
+        """
+        Returns the rate-limiting policy and the associated interval
+        in milliseconds for the supplied bokeh model property.
+        """
+        policy = self.update_policy
+        if isinstance(policy, dict):
+            released = {v: k for k, v in self._release_properties.items()}
+            inverted = self._get_property_mapping()[1]
+            attr = released.get(attr, attr)
+            policy = policy.get(inverted.get(attr, attr), 'debounce')
+        interval = self.throttle if policy == 'throttle' else self.debounce
+        return policy, interval
+
+    def _release_property(self, model, prop):
+        """
+        Returns the property which is linked to sync the supplied
+        model property, i.e. the property which only changes once the
+        widget is released if the 'release' policy applies to it.
+        """
+        release = self._release_properties.get(prop)
+        if (release is None or release not in model.properties() or
+            self._get_update_policy(prop)[0] != 'release'):
+            return prop
+        return release
+
     def _server_change(self, doc, attr, old, new):
         self._events.update({attr: new})
-        if not self._processing:
-            self._processing = True
-            doc.add_timeout_callback(partial(self._change_event, doc), self._debounce)
+        if self._processing:
+            return
+        self._processing = True
+        cb = partial(self._change_event, doc)
+        policy, interval = self._get_update_policy(attr)
+        if policy == 'throttle':
+            # Process immediately unless the last event was processed
+            # less than one interval ago
+            interval -= (time.time() - self._last_change) * 1000
+            if interval <= 0:
+                doc.add_next_tick_callback(cb)
+                return
+        doc.add_timeout_callback(cb, interval)
 
+    @timed
     def _change_event(self, doc=None):
+        if doc is not None and state._thread_pool is not None:
+            # Process events on the thread pool, model updates are
+            # applied on the next tick of the Document. Events which
+            # arrive before the queued events are processed supersede
+            # them, so only the latest value of each property is
+            # processed.
+            with state._lock:
+                queued = doc in self._thread_events
+                self._thread_events.setdefault(doc, {}).update(self._events)
+            self._events = {}
+            self._processing = False
+            self._last_change = time.time()
+            if not queued:
+                state._submit(doc, partial(self._process_thread_events, doc))
+            return
         try:
             state.curdoc = doc
             thread = threading.current_thread()
@@ -670,30 +1135,68 @@ class Reactive(Viewable):
             state._thread_id = thread_id
             events = self._events
             self._events = {}
-            self.set_param(**self._process_property_change(events))
+            if doc is None:
+                timed_call(self._process_events, events)
+            else:
+                with hold(doc):
+                    timed_call(self._process_events, events)
         finally:
             self._processing = False
+            self._last_change = time.time()
             state.curdoc = None
             state._thread_id = None
 
+    def _process_thread_events(self, doc):
+        with state._lock:
+            events = self._thread_events.pop(doc, {})
+        if events:
+            timed_call(self._process_events, events)
+
+    def _process_events(self, events):
+        self.set_param(**self._process_property_change(events))
+
     def _get_customjs(self, change, client_comm, plot_id):
         """
         Returns a CustomJS callback that can be attached to send the
         model state across the notebook comms.
         """
+        policy, interval = self._get_update_policy(change)
+        throttle = interval if policy == 'throttle' else None
         return get_comm_customjs(change, client_comm, plot_id,
-                                 self._timeout, self._debounce)
+                                 self._timeout, self.debounce, throttle)
 
     #----------------------------------------------------------------
     # Model API
     #----------------------------------------------------------------
 
     def _init_properties(self):
+        synced = self._synced_params()
         return {k: v for k, v in self.param.get_param_values()
-                if v is not None}
+                if k in synced and v is not None}
 
     def _synced_params(self):
-        return list(self.param)
+        return [p for p in self.param if p not in self._policy_params
+                or p in self._rename]
+
+    def _get_property_mapping(self):
+        """
+        Returns the forward mapping from parameter to property names,
+        the inverse mapping from property to parameter names and the
+        set of parameters which are not synced, compiled from the
+        _rename dictionary once per class.
+        """
+        cls = type(self)
+        rename = self._rename
+        mapping = Reactive._property_mappings.get(cls)
+        if mapping is None or mapping[0] is not rename:
+            forward = {k: v for k, v in rename.items() if v is not None}
+            dropped = frozenset([k for k, v in rename.items() if v is None] +
+                                [p for p in Reactive._policy_params if p not in rename])
+            inverted = {v: k for k, v in forward.items()}
+            mapping = (rename, forward, inverted, dropped)
+            if rename is cls._rename:
+                Reactive._property_mappings[cls] = mapping
+        return mapping[1:]
 
     def _process_property_change(self, msg):
         """
@@ -703,7 +1206,9 @@ class Reactive(Viewable):
         _rename class level attribute to map between parameter and
         property names.
         """
-        inverted = {v: k for k, v in self._rename.items()}
+        inverted = self._get_property_mapping()[1]
+        released = {v: k for k, v in self._release_properties.items()}
+        msg = {released.get(k, k): v for k, v in msg.items()}
         return {inverted.get(k, k): v for k, v in msg.items()}
 
     def _process_param_change(self, msg):
@@ -714,8 +1219,9 @@ class Reactive(Viewable):
         _rename class level attribute to map between parameter and
         property names.
         """
-        properties = {self._rename.get(k, k): v for k, v in msg.items()
-                      if self._rename.get(k, False) is not None}
+        forward, _, dropped = self._get_property_mapping()
+        properties = {forward.get(k, k): v for k, v in msg.items()
+                      if k not in dropped}
         if 'width' in properties and self.sizing_mode is None:
             properties['min_width'] = properties['width']
         if 'height' in properties and self.sizing_mode is None:
@@ -763,6 +1269,7 @@ class Reactive(Viewable):
           The target object of the link.
         callbacks: dict
           Maps from a parameter in the source object to a callback.
+          Coroutine functions are scheduled on the running IOLoop.
         **links: dict
           Maps between parameters on this object to the parameters
           on the supplied object.
@@ -782,7 +1289,7 @@ class Reactive(Viewable):
                 _updating.append(event.name)
                 try:
                     if callbacks:
-                        callbacks[event.name](target, event)
+                        state.execute(callbacks[event.name], target, event)
                     else:
                         setattr(target, links[event.name], event.new)
                 except:
@@ -38,6 +38,9 @@ class Widget(Reactive):
 
     _rename = {'name': 'title'}
 
+    # Cache of the linked model properties of each class
+    _linked_properties = {}
+
     def __init__(self, **params):
         if 'name' not in params:
             params['name'] = ''
@@ -50,12 +53,33 @@ class Widget(Reactive):
         if root is None:
             root = model
         # Link parameters and bokeh model
-        values = dict(self.get_param_values())
-        properties = self._filter_properties(list(self._process_param_change(values)))
+        properties = self._get_linked_properties()
         self._models[root.ref['id']] = (model, parent)
         self._link_props(model, properties, doc, root, comm)
         return model
 
+    def _get_linked_properties(self):
+        """
+        Returns the model properties which are linked to parameters.
+        If parameters are mapped to properties by the default
+        _process_param_change, i.e. only using the _rename dictionary,
+        the properties do not depend on the parameter values and are
+        computed once per class. Classes which override
+        _process_param_change may drop or rename properties depending
+        on the parameter values and are computed for each model.
+        """
+        cls = type(self)
+        cached = Widget._linked_properties.get(cls)
+        if cached is not None and cached[0] is self._rename:
+            return list(cached[1])
+        synced = self._synced_params()
+        values = {k: v for k, v in self.get_param_values() if k in synced}
+        properties = self._filter_properties(list(self._process_param_change(values)))
+        owner = [c for c in cls.__mro__ if '_process_param_change' in c.__dict__][0]
+        if self._rename is cls._rename and owner is Reactive:
+            Widget._linked_properties[cls] = (self._rename, properties)
+        return list(properties)
+
     def _filter_properties(self, properties):
         return [p for p in properties if p not in Layoutable.param]
 
@@ -96,25 +120,14 @@ class CompositeWidget(Widget):
 
     __abstract = True
 
-    def select(self, selector=None):
-        """
-        Iterates over the Viewable and any potential children in the
-        applying the Selector.
+    def _selection_version(self):
+        return self._composite._selection_version()
 
-        Arguments
-        ---------
-        selector: type or callable or None
-          The selector allows selecting a subset of Viewables by
-          declaring a type or callable function to filter by.
-
-        Returns
-        -------
-        viewables: list(Viewable)
-        """
-        objects = super(CompositeWidget, self).select(selector)
+    def _traverse(self):
+        yield self
         for obj in self._composite.objects:
-            objects += obj.select(selector)
-        return objects
+            for child in obj._traverse():
+                yield child
 
     def _get_model(self, doc, root=None, parent=None, comm=None):
         return self._composite._get_model(doc, root, parent, comm)
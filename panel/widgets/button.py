@@ -4,10 +4,13 @@ or merely toggling between on-off states.
 """
 from __future__ import absolute_import, division, unicode_literals
 
+from functools import partial
+
 import param
 
 from bokeh.models import Button as _BkButton, Toggle as _BkToggle
 
+from ..io.state import state
 from .base import Widget
 
 
@@ -28,7 +31,17 @@ class Button(_ButtonBase):
     _widget_type = _BkButton
 
     def on_click(self, callback):
-        self.param.watch(callback, 'clicks')
+        """
+        Registers a callback to be executed when the button is
+        clicked. Coroutine functions are scheduled on the running
+        IOLoop.
+
+        Arguments
+        ---------
+        callback: callable
+          The (coroutine) function to call with the click event
+        """
+        return self.param.watch(partial(state.execute, callback), 'clicks')
 
 
 class Toggle(_ButtonBase):
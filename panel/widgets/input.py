@@ -263,7 +263,9 @@ class DatetimeInput(LiteralInput):
         return msg
 
     def _process_param_change(self, msg):
-        msg = {k: v for k, v in msg.items() if k not in ('type', 'format', 'start', 'end')}
+        dropped = self._get_property_mapping()[2]
+        msg = {k: v for k, v in msg.items()
+               if k not in ('type', 'format', 'start', 'end') and k not in dropped}
         if 'value' in msg:
             value = msg['value']
             if value is None:
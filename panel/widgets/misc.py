@@ -38,7 +38,9 @@ class Audio(Widget):
 
     _widget_type = _BkAudio
 
-    _rename = {'name': None}
+    # The throttle is synced with the model rather than configuring
+    # the update policy
+    _rename = {'name': None, 'throttle': 'throttle'}
 
     def _process_param_change(self, msg):
         msg = super(Audio, self)._process_param_change(msg)
@@ -79,6 +81,8 @@ class VideoStream(Widget):
         """
         for ref, (m, _) in self._models.items():
             m.snapshot = not m.snapshot
+            if ref not in state._views:
+                continue
             (self, root, doc, comm) = state._views[ref]
             if comm and 'embedded' not in root.tags:
                 push(doc, comm)
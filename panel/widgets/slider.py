@@ -57,6 +57,8 @@ class _SliderBase(Widget):
 
     _widget_type = _BkSlider
 
+    _release_properties = {'value': 'value_throttled'}
+
     __abstract = True
 
 